@@ -0,0 +1,245 @@
+"""
+Times every stage of the deck pipeline on synthetic rosters of growing size, so
+the stage that stops scaling shows up before a real roster reaches it.
+
+Run from the repository root:
+    python benchmarks/pipeline_benchmark.py [--players 10 100 1000] [--output results.json]
+
+Add 10000 to --players for the full range; --stream keeps that run's memory
+flat. Each size builds one deck in a temporary directory, from generated data
+and placeholder images served by an offline image cache, so no network is used
+and nothing in the repository is touched. The timings are printed as a table
+and written as JSON; pass an earlier JSON file as --baseline to print the ratio
+of every stage against it.
+
+Stages:
+    filtering        the player's rows and personal info (_prepare_player_df)
+    images           prefetching the photos and flags from the image cache
+    matplotlib       the PNG charts (none with --charts native)
+    plotly_html      the interactive HTML pages or dashboard
+    info_slide       add_player_info
+    chart_slide      add_slide, including the native charts
+    aggregate_slide  add_aggregate_slide
+    save             writing the deck (and each streamed player's slides)
+    other            everything else, e.g. the digests and the render cache
+A stage called from inside another one is counted in the outer stage only.
+"""
+
+import argparse
+import contextlib
+import importlib.metadata
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(os.path.join(REPO_DIR, "classes"))
+
+from custom_presentation import CHART_BACKENDS, DECORATION_MODES, CustomPresentation
+from image_cache import ImageCache
+from image_fetcher import ImageFetcher
+from ppt_generator import HTML_MODES, PowerPointGenerator
+from render_cache import RenderCache
+from synthetic_roster import placeholder_images, synthetic_roster
+
+# (stage, owner, attribute); the owner is "generator" for the generator instance
+STAGES = [
+    ("filtering", "generator", "_prepare_player_df"),
+    ("filtering", "store", "personal_info"),
+    ("images", "generator", "_prefetch_player_images"),
+    ("matplotlib", "generator", "plot_time_series"),
+    ("plotly_html", "generator", "create_graph_html_from_scores"),
+    ("plotly_html", "generator", "create_dashboard_html"),
+    ("info_slide", CustomPresentation, "add_player_info"),
+    ("chart_slide", CustomPresentation, "add_slide"),
+    ("aggregate_slide", CustomPresentation, "add_aggregate_slide"),
+    ("save", CustomPresentation, "flush"),
+    ("save", CustomPresentation, "save"),
+]
+STAGE_NAMES = list(dict.fromkeys(stage for stage, _, _ in STAGES)) + ["other"]
+
+
+class StageTimer:
+    """Wraps methods so the time spent in them is added up per stage."""
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(STAGE_NAMES, 0.0)
+        self.calls = dict.fromkeys(STAGE_NAMES, 0)
+        self._depth = 0
+        self._patched = []
+
+    def wrap(self, owner, name, stage):
+        original = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            if self._depth:
+                return original(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.seconds[stage] += time.perf_counter() - start
+                self.calls[stage] += 1
+                self._depth -= 1
+
+        # Class attributes are restored; instance attributes are simply dropped
+        self._patched.append((owner, name, owner.__dict__.get(name)))
+        setattr(owner, name, timed)
+
+    def restore(self):
+        for owner, name, original in reversed(self._patched):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._patched = []
+
+
+def seed_image_cache(cache_dir, personal_data):
+    """Stores the placeholder photos and flags in an offline image cache."""
+    cache = ImageCache(cache_dir=cache_dir, max_bytes=float("inf"), offline=True)
+    for url, content in placeholder_images(personal_data):
+        cache.store(url, content)
+    cache.save()
+    return cache
+
+
+def run_size(players, args):
+    """Builds one deck of `players` synthetic players and returns its timings."""
+    data, personal_data = synthetic_roster(players, args.centuries)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        # The decks read the logo from assets/ relative to the working directory
+        shutil.copytree(os.path.join(REPO_DIR, "assets"), os.path.join(work_dir, "assets"))
+        os.chdir(work_dir)
+        timer = StageTimer()
+        try:
+            cache = seed_image_cache(os.path.join(work_dir, ".image_cache"), personal_data)
+            generator = PowerPointGenerator(
+                data,
+                personal_data,
+                image_fetcher=ImageFetcher(cache=cache),
+                render_cache=RenderCache(os.path.join(work_dir, ".render_cache.json")),
+            )
+            owners = {"generator": generator, "store": generator.store}
+            for stage, owner, name in STAGES:
+                timer.wrap(owners.get(owner, owner), name, stage)
+
+            start = time.perf_counter()
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                generator._handle_general_flow(
+                    key="Benchmark",
+                    name="Male",
+                    html_mode=args.html,
+                    decoration=args.decoration,
+                    stream=args.stream,
+                    chart_backend=args.charts,
+                )
+            total = time.perf_counter() - start
+            deck_bytes = os.path.getsize("PPTS/player_Benchmark.pptx")
+        finally:
+            timer.restore()
+            os.chdir(cwd)
+
+    timer.seconds["other"] = total - sum(timer.seconds.values())
+    return {
+        "players": players,
+        "rows": len(data),
+        "total_seconds": round(total, 4),
+        "ms_per_player": round(total * 1000 / players, 2),
+        "deck_bytes": deck_bytes,
+        "stages": {
+            stage: {
+                "calls": timer.calls[stage],
+                "seconds": round(timer.seconds[stage], 4),
+            }
+            for stage in STAGE_NAMES
+        },
+    }
+
+
+def print_run(run, baseline=None):
+    print(
+        f"\n{run['players']} players, {run['rows']} centuries: "
+        f"{run['total_seconds']:.2f}s ({run['ms_per_player']:.1f} ms/player), "
+        f"deck {run['deck_bytes'] / 1e6:.1f} MB"
+    )
+    header = f"{'stage':<16} {'calls':>7} {'seconds':>9} {'share':>6}"
+    print(header + ("  vs baseline" if baseline else ""))
+    for stage, timing in run["stages"].items():
+        line = (
+            f"{stage:<16} {timing['calls']:>7} {timing['seconds']:>9.3f} "
+            f"{timing['seconds'] / run['total_seconds']:>6.1%}"
+        )
+        if baseline:
+            before = baseline["stages"].get(stage, {}).get("seconds")
+            if before:
+                line += f"  {timing['seconds'] / before:>6.2f}x"
+        print(line)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time the deck pipeline per stage.")
+    parser.add_argument(
+        "--players",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Roster sizes to build, e.g. 10 100 1000 10000.",
+    )
+    parser.add_argument(
+        "--centuries", type=int, default=20, help="Average centuries per player."
+    )
+    parser.add_argument("--charts", choices=CHART_BACKENDS, default="png")
+    parser.add_argument("--html", choices=HTML_MODES, default="pages")
+    parser.add_argument("--decoration", choices=DECORATION_MODES, default="boxes")
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument(
+        "--output",
+        default="pipeline_benchmark.json",
+        help="Where to write the timings as JSON.",
+    )
+    parser.add_argument(
+        "--baseline", help="JSON file of an earlier run to compare the stages against."
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = {run["players"]: run for run in json.load(f)["runs"]}
+
+    results = {
+        "metadata": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "versions": {
+                package: importlib.metadata.version(package)
+                for package in ("pandas", "matplotlib", "plotly", "python-pptx")
+            },
+            "args": vars(args),
+        },
+        "runs": [],
+    }
+    for players in args.players:
+        run = run_size(players, args)
+        results["runs"].append(run)
+        print_run(run, baseline.get(players))
+
+        # Written after every size, so a long run keeps the sizes it finished
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    print(f"\nTimings written to {args.output}")
@@ -0,0 +1,184 @@
+"""
+Times the cold start of the generator: importing its modules and building the
+first player's slides, each in a fresh interpreter.
+
+Run from the repository root:
+    python benchmarks/startup_benchmark.py [--repeat 5] [--output startup_benchmark.json]
+
+Every measurement starts a new python process, so nothing imported by an
+earlier one is reused, and reports the median and best of --repeat runs. The
+first-slide scenarios build a one-player synthetic roster whose images come
+from an offline image cache, so no network is used. Run
+`python main.py --prewarm-fonts` first when timing a fresh environment, or the
+first run also pays for matplotlib's font scan.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.join(BENCHMARK_DIR, "..")
+
+# Scenario -> what it times
+SCENARIOS = {
+    "import_ppt_generator": "import ppt_generator",
+    "import_custom_presentation": "import custom_presentation",
+    "first_slide_png": "imports, then one player's PNG charts and slides",
+    "first_slide_native": "imports, then one player's native-chart slides",
+}
+
+
+def run_child(scenario):
+    """Runs one scenario in this (fresh) process and returns its phase timings."""
+    start = time.perf_counter()
+    sys.path.append(os.path.join(REPO_DIR, "classes"))
+    sys.path.append(BENCHMARK_DIR)
+
+    if scenario == "import_custom_presentation":
+        import custom_presentation  # noqa: F401
+
+        return {"import": time.perf_counter() - start}
+
+    import ppt_generator
+
+    timings = {"import": time.perf_counter() - start}
+    if scenario == "import_ppt_generator":
+        return timings
+
+    import contextlib
+    import shutil
+
+    from custom_presentation import CustomPresentation
+    from image_fetcher import ImageFetcher
+    from pipeline_benchmark import seed_image_cache
+    from render_cache import RenderCache
+    from synthetic_roster import synthetic_roster
+
+    mark = time.perf_counter()
+    work_dir = tempfile.mkdtemp()
+    try:
+        shutil.copytree(os.path.join(REPO_DIR, "assets"), os.path.join(work_dir, "assets"))
+        os.chdir(work_dir)
+        data, personal_data = synthetic_roster(1, 20)
+        cache = seed_image_cache(os.path.join(work_dir, ".image_cache"), personal_data)
+        generator = ppt_generator.PowerPointGenerator(
+            data,
+            personal_data,
+            image_fetcher=ImageFetcher(cache=cache),
+            render_cache=RenderCache(os.path.join(work_dir, ".render_cache.json")),
+        )
+        timings["setup"] = time.perf_counter() - mark
+
+        mark = time.perf_counter()
+        chart_backend = "native" if scenario == "first_slide_native" else "png"
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            player = generator.store.players("Male")[0]
+            player_df = generator._prepare_player_df("Male", player)
+            player_info = generator.store.personal_info(player)
+            filename_a, filename_b = generator.render_player_assets(
+                player_df, player, "Benchmark", write_png=chart_backend == "png"
+            )
+            prs = CustomPresentation(
+                "Benchmark",
+                "Male",
+                image_fetcher=generator.image_fetcher,
+                image_preparer=generator.image_preparer,
+                chart_backend=chart_backend,
+                chart_style=ppt_generator.CHART_STYLE,
+            )
+            prs.add_player_info(player, player_info, total_cen=len(player_df))
+            prs.add_slide(
+                player,
+                [filename_a, filename_b],
+                player_df,
+                generator._html_link(player, "Benchmark", "pages"),
+            )
+        timings["first_slide"] = time.perf_counter() - mark
+    finally:
+        os.chdir(REPO_DIR)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def measure(scenario, repeat):
+    """Runs `scenario` in `repeat` fresh interpreters and returns its phase stats."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", scenario],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings = json.loads(output.splitlines()[-1])
+        timings["process"] = time.perf_counter() - start
+        runs.append(timings)
+
+    return {
+        phase: {
+            "median": round(statistics.median(run[phase] for run in runs), 4),
+            "best": round(min(run[phase] for run in runs), 4),
+        }
+        for phase in runs[0]
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time the generator's cold start.")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Fresh processes per scenario."
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+    )
+    parser.add_argument(
+        "--output",
+        default="startup_benchmark.json",
+        help="Where to write the timings as JSON.",
+    )
+    parser.add_argument("--child", choices=list(SCENARIOS), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child)))
+        sys.exit()
+
+    results = {
+        "metadata": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "scenarios": {},
+    }
+    print(f"{'scenario':<28} {'phase':<12} {'median s':>9} {'best s':>9}")
+    for scenario in args.scenarios:
+        stats = measure(scenario, args.repeat)
+        results["scenarios"][scenario] = stats
+        for phase, values in stats.items():
+            print(
+                f"{scenario:<28} {phase:<12} {values['median']:>9.3f} "
+                f"{values['best']:>9.3f}"
+            )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nTimings written to {args.output}")
@@ -0,0 +1,121 @@
+"""
+Builds processed_data- and personal_data-shaped frames for any number of
+players, plus placeholder photos and flags, so the pipeline can be benchmarked
+at sizes the real workbooks do not reach and without the network.
+"""
+
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw
+
+COUNTRIES = [
+    "Australia",
+    "England",
+    "India",
+    "New Zealand",
+    "Pakistan",
+    "South Africa",
+    "Sri Lanka",
+    "West Indies",
+]
+FORMATS = ["Test", "ODI", "T20I"]
+VENUES = [
+    "Melbourne Cricket Ground, Melbourne",
+    "Lord's, London",
+    "Eden Gardens, Kolkata",
+    "Newlands, Cape Town",
+    "Basin Reserve, Wellington",
+]
+MONTHS = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+# Placeholder image URLs; they are served from the offline image cache
+PHOTO_URL = "https://placeholder.invalid/players/{}.jpg"
+FLAG_URL = "https://placeholder.invalid/flags/{}.png"
+
+
+def synthetic_roster(players, centuries, gender="Male", seed=0):
+    """Returns (data, personal_data) for `players` players with about `centuries` each.
+
+    The century counts vary from half to one and a half times `centuries`, so
+    the charts and tables get players of different sizes."""
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(
+        max(1, centuries // 2), max(2, centuries * 3 // 2 + 1), players
+    )
+    names = [f"Player {idx:05d}" for idx in range(players)]
+    countries = rng.choice(COUNTRIES, players)
+
+    rows = int(counts.sum())
+    player_idx = np.repeat(np.arange(players), counts)
+    years = rng.integers(1950, 2025, rows)
+    days = rng.integers(1, 29, rows)
+    months = rng.integers(0, 12, rows)
+    data = pd.DataFrame(
+        {
+            "Unnamed: 0": np.arange(rows),
+            "Score": rng.integers(100, 300, rows),
+            "Against": rng.choice(COUNTRIES, rows),
+            "Venue": rng.choice(VENUES, rows),
+            "Date": [
+                f"{day} {MONTHS[month]} {year}"
+                for day, month, year in zip(days, months, years)
+            ],
+            "country": countries[player_idx],
+            "gender": gender,
+            "name": np.array(names)[player_idx],
+            "Format": rng.choice(FORMATS, rows),
+        }
+    )
+
+    personal_data = pd.DataFrame(
+        {
+            "Unnamed: 0": np.arange(players),
+            "Name": names,
+            "Country": countries,
+            "Mother": [f"Mother of {name}" for name in names],
+            "Father": [f"Father of {name}" for name in names],
+            "DOB": [f"{rng.integers(1, 29)} Aug {rng.integers(1930, 2000)}" for _ in names],
+            "Birth Place": rng.choice(VENUES, players),
+            "Height": "5'8\"",
+            "Marital Status": rng.choice(["Married", "Unmarried"], players),
+            "Retired": rng.choice(["Yes", "No"], players),
+            "Flag": [FLAG_URL.format(country.replace(" ", "_")) for country in countries],
+            "Image": [PHOTO_URL.format(idx) for idx in range(players)],
+        }
+    )
+    return data, personal_data
+
+
+def placeholder_images(personal_data, seed=0):
+    """Yields (url, bytes) for every photo and flag of `personal_data`.
+
+    Each player gets a distinct JPEG, so the deck holds one photo per player as
+    it would with real downloads; flags are shared per country."""
+    rng = np.random.default_rng(seed)
+    for idx, url in enumerate(personal_data["Image"]):
+        image = Image.new("RGB", (330, 400), tuple(int(c) for c in rng.integers(0, 256, 3)))
+        ImageDraw.Draw(image).text((20, 20), f"Player {idx:05d}", fill=(255, 255, 255))
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", quality=85)
+        yield url, buffer.getvalue()
+
+    for url in personal_data["Flag"].unique():
+        image = Image.new("RGB", (360, 240), tuple(int(c) for c in rng.integers(0, 256, 3)))
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        yield url, buffer.getvalue()
@@ -0,0 +1,183 @@
+"""
+Times the score and aggregate tables against their row count, built by the bulk
+table writer and by the previous cell-by-cell python-pptx code.
+
+Run from the repository root:
+    python benchmarks/table_writer_benchmark.py [--rows 10 100 1000 5000]
+
+Both builds of every table are also compared, so a mismatch in the generated XML
+is reported next to the timings.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "classes"))
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from custom_presentation import CustomPresentation
+from table_writer import AGGREGATE_TABLE_STYLE
+
+
+def legacy_score_table(prs, slide, score_data, width, top, right):
+    """_add_score_table as it was before the bulk writer."""
+    left = prs.prs.slide_width - right - width
+    rows, cols = score_data.shape
+    shape = slide.shapes.add_table(
+        rows + 1, cols, left, top, width, Inches(0.2 * (rows + 1))
+    )
+    tbl = shape._element.graphic.graphicData.tbl
+    tbl[0][-1].text = "{69012ECD-51FC-41F1-AA8D-1B2483CD663E}"
+    table = shape.table
+
+    for col_idx, column_name in enumerate(score_data.columns):
+        cell = table.cell(0, col_idx)
+        cell.text = column_name
+        cell.text_frame.paragraphs[0].font.size = Pt(12)
+
+    for row_idx, (index, row) in enumerate(score_data.iterrows(), start=1):
+        for col_idx, value in enumerate(row):
+            cell = table.cell(row_idx, col_idx)
+            cell.text = str(value)
+            cell.text_frame.paragraphs[0].font.size = Pt(11)
+    return shape._element
+
+
+def legacy_aggregate_table(slide, table_data, width, left, extra_header, merge_indices):
+    """The table part of add_aggregate_slide as it was before the bulk writer."""
+    top = Inches(1)
+    rows, cols = table_data.shape
+    extra = 1 if extra_header and merge_indices else 0
+    shape = slide.shapes.add_table(
+        rows + 1 + extra, cols, left, top, width, Inches(0.2 * (rows + 1 + extra))
+    )
+    tbl = shape._element.graphic.graphicData.tbl
+    tbl[0][-1].text = "{69012ECD-51FC-41F1-AA8D-1B2483CD663E}"
+    table = shape.table
+
+    if extra:
+        for (start_col, end_col), text in zip(merge_indices, extra_header):
+            cell_start = table.cell(0, start_col)
+            cell_start.merge(table.cell(0, end_col - 1))
+            cell_start.text = text
+            cell_start.text_frame.paragraphs[0].font.size = Pt(16)
+            cell_start.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+    for col_idx, column_name in enumerate(table_data.columns):
+        cell = table.cell(extra, col_idx)
+        cell.text = column_name
+        cell.text_frame.paragraphs[0].font.size = Pt(16)
+        if col_idx > 0:
+            cell.text_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
+
+    for row_idx, (index, row) in enumerate(table_data.iterrows(), start=1):
+        for col_idx, value in enumerate(row):
+            cell = table.cell(row_idx + extra, col_idx)
+            cell.text = str(value)
+            cell.text_frame.paragraphs[0].font.size = Pt(14)
+            if col_idx > 0:
+                cell.text_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
+    return shape._element
+
+
+def score_frame(rows, rng):
+    return pd.DataFrame(
+        {
+            "Year": rng.integers(1990, 2025, rows),
+            "Centuries": rng.integers(1, 10, rows),
+        }
+    )
+
+
+def aggregate_frame(rows, rng):
+    names = [f"Player {i} & <Co>" for i in range(rows)]
+    names[0] = "Two\nlines\vand a tab\t"
+    return pd.DataFrame(
+        {
+            "Name": names,
+            "Country": rng.choice(["India", "Australia", "England"], rows),
+            "Total Centuries": rng.integers(1, 100, rows),
+        }
+    )
+
+
+def timed(build):
+    start = time.perf_counter()
+    element = build()
+    return time.perf_counter() - start, element
+
+
+def xml_of(element):
+    return etree.tostring(element)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    prs = CustomPresentation("Benchmark", "Benchmark")
+    merge = ([(0, 2), (2, 3)], ["Player", "Runs"])
+
+    print(f"{'table':<10}{'rows':>8}{'legacy (s)':>14}{'bulk (s)':>12}{'speed-up':>10}  same XML")
+    for rows in args.rows:
+        data = score_frame(rows, rng)
+        legacy_time, legacy = timed(
+            lambda: legacy_score_table(
+                prs, prs._get_new_slide(), data, Inches(2), Inches(1), Inches(0.3)
+            )
+        )
+        slide = prs._get_new_slide()
+        bulk_time, _ = timed(
+            lambda: prs._add_score_table(slide, data, Inches(2), top=Inches(1))
+        )
+        bulk = slide.shapes._spTree.xpath("./p:graphicFrame")[-1]
+        print(
+            f"{'score':<10}{rows:>8}{legacy_time:>14.3f}{bulk_time:>12.3f}"
+            f"{legacy_time / bulk_time:>9.1f}x  {xml_of(legacy) == xml_of(bulk)}"
+        )
+
+        data = aggregate_frame(rows, rng)
+        for extra_header, merge_indices in [(None, None), (merge[1], merge[0])]:
+            legacy_time, legacy = timed(
+                lambda: legacy_aggregate_table(
+                    prs._get_new_slide(),
+                    data,
+                    Inches(7.5),
+                    Inches(3.5),
+                    extra_header,
+                    merge_indices,
+                )
+            )
+            slide = prs._get_new_slide()
+            values = data.values
+            bulk_time, bulk = timed(
+                lambda: prs._add_table(
+                    slide,
+                    Inches(3.5),
+                    Inches(1),
+                    Inches(7.5),
+                    Inches(0.2 * (rows + 1 + (1 if extra_header else 0))),
+                    list(data.columns),
+                    [values[:, col_idx] for col_idx in range(values.shape[1])],
+                    AGGREGATE_TABLE_STYLE,
+                    list(zip(merge_indices, extra_header)) if extra_header else None,
+                )
+            )
+            label = "aggregate" + ("+" if extra_header else "")
+            print(
+                f"{label:<10}{rows:>8}{legacy_time:>14.3f}{bulk_time:>12.3f}"
+                f"{legacy_time / bulk_time:>9.1f}x  {xml_of(legacy) == xml_of(bulk)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Times the cleaning of scraped century tables on a large synthetic frame, with
+the vectorized text cleaner and with the per-cell cleaning prepare_data.ipynb
+used before it.
+
+Run from the repository root:
+    python benchmarks/text_cleaning_benchmark.py [--rows 1000000] [--distinct]
+
+The frame repeats a realistic set of scores, opponents, venues and years, each
+with footnotes and not-out stars; --distinct makes every venue unique, the
+worst case for the cleaner's one-pass-per-distinct-value. Both results are
+compared: the cleaned text must match cell for cell and the parsed runs must
+equal the legacy cleaned scores.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "classes"))
+
+import numpy as np
+import pandas as pd
+
+from text_cleaner import clean_table
+
+OPPONENTS = ["England", "India", "Sri Lanka", "New Zealand", "West Indies", "Pakistan"]
+VENUES = [
+    "Lord's, London",
+    "Melbourne Cricket Ground, Melbourne",
+    "Eden Gardens, Kolkata",
+    "Basin Reserve, Wellington",
+    "Kensington Oval, Bridgetown",
+    "Galle International Stadium, Galle",
+]
+FOOTNOTES = ["", "", "", "[a]", "[12]", " †", "‡"]
+COLUMNS = ["Score", "Against", "Venue", "Year"]
+
+
+def legacy_remove_special_characters(df, columns):
+    """The cleaning of remove_special_characters as prepare_data.ipynb had it."""
+    df_cleaned = df.copy()
+
+    for col in columns:
+        if col in df_cleaned.columns:
+            df_cleaned[col] = (
+                df_cleaned[col]
+                .astype(str)
+                .apply(lambda x: re.sub(r"\[.*?\]", "", x))
+                .apply(lambda x: re.sub(r"[^\w\s]", "", x))
+                .str.strip()
+            )
+    if "No." in df_cleaned.columns:
+        df_cleaned = df_cleaned.drop(columns=["No."])
+    return df_cleaned
+
+
+def synthetic_table(rows, distinct=False, seed=0):
+    """Returns a scraped-looking table of `rows` centuries."""
+    rng = np.random.default_rng(seed)
+    runs = rng.integers(100, 400, rows)
+    not_out = rng.random(rows) < 0.2
+    footnotes = np.array(FOOTNOTES)[rng.integers(0, len(FOOTNOTES), rows)]
+    venues = np.array(VENUES)[rng.integers(0, len(VENUES), rows)]
+    if distinct:
+        venues = np.char.add(venues, np.char.mod(" %d", np.arange(rows)))
+
+    return pd.DataFrame(
+        {
+            "No.": np.arange(1, rows + 1),
+            "Score": [
+                f"{score}{'*' if star else ''}{note}"
+                for score, star, note in zip(runs, not_out, footnotes)
+            ],
+            "Against": np.char.add(
+                np.array(OPPONENTS)[rng.integers(0, len(OPPONENTS), rows)], footnotes
+            ),
+            "Venue": np.char.add(venues, footnotes),
+            "Year": rng.integers(1930, 2025, rows).astype(str),
+        }
+    )
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time the scraped-table cleaning.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--distinct", action="store_true", help="Make every venue a distinct value."
+    )
+    parser.add_argument(
+        "--output",
+        default="text_cleaning_benchmark.json",
+        help="Where to write the timings as JSON.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    table, build_seconds = timed(synthetic_table, args.rows, args.distinct)
+    print(f"{args.rows} rows built in {build_seconds:.2f}s")
+
+    legacy, legacy_seconds = timed(legacy_remove_special_characters, table, COLUMNS)
+    cleaned, cleaner_seconds = timed(clean_table, table, COLUMNS, score="Score")
+
+    text_columns = [column for column in COLUMNS if column != "Score"]
+    matches = legacy[text_columns].equals(cleaned[text_columns]) and (
+        legacy["Score"].astype(np.int64).equals(cleaned["Score"].astype(np.int64))
+    )
+    score_bytes = {
+        "legacy": int(legacy["Score"].memory_usage(deep=True, index=False)),
+        "cleaner": int(cleaned["Score"].memory_usage(deep=True, index=False)),
+    }
+
+    print(f"{'cleaning':<10} {'seconds':>9} {'Score MB':>9}")
+    print(f"{'legacy':<10} {legacy_seconds:>9.3f} {score_bytes['legacy'] / 1e6:>9.1f}")
+    print(
+        f"{'cleaner':<10} {cleaner_seconds:>9.3f} {score_bytes['cleaner'] / 1e6:>9.1f}"
+    )
+    print(
+        f"{legacy_seconds / cleaner_seconds:.1f}x faster, Score as "
+        f"{cleaned['Score'].dtype}, {int(cleaned['not_out'].sum())} not-outs, "
+        f"results {'match' if matches else 'DIFFER'}"
+    )
+
+    results = {
+        "metadata": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "args": vars(args),
+        },
+        "seconds": {
+            "legacy": round(legacy_seconds, 4),
+            "cleaner": round(cleaner_seconds, 4),
+        },
+        "score_bytes": score_bytes,
+        "score_dtype": str(cleaned["Score"].dtype),
+        "matches": matches,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nTimings written to {args.output}")
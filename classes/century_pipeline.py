@@ -0,0 +1,175 @@
+import io
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import pandas as pd
+
+from century_sources import OUTPUT_COLUMNS, ROW_COLUMNS, SOURCES
+from image_cache import ImageCache
+from image_fetcher import ImageFetcher
+from text_cleaner import clean_table
+from tracing import NULL_TRACER
+
+# Wikipedia turns away requests without a descriptive User-Agent
+USER_AGENT = "ppt-automation-data-prep/1.0 (python-requests)"
+
+
+class SnapshotCache(ImageCache):
+    """On-disk cache of the raw HTML of the scraped pages.
+
+    The same content-addressed store as the image cache, without a size cap;
+    the snapshots never expire unless `refresh` revalidates every one."""
+
+    def __init__(self, cache_dir=".html_cache", offline=False, refresh=False):
+        super().__init__(
+            cache_dir=cache_dir,
+            max_bytes=float("inf"),
+            max_age=0 if refresh else float("inf"),
+            offline=offline,
+        )
+
+
+class PageFetcher(ImageFetcher):
+    """Downloads the scraped pages through a SnapshotCache, traced as page_download."""
+
+    span_name = "page_download"
+
+
+def _read_table(tables, spec, source):
+    """Returns the table `spec` describes, out of a page's `tables`."""
+    if spec.index >= len(tables):
+        raise ValueError(
+            f"{source.name}: the page has {len(tables)} tables, "
+            f"no table {spec.index} ({spec.format})"
+        )
+    table = tables[spec.index]
+    if spec.drop_last:
+        table = table.iloc[:, :-1]
+    if spec.flatten_header:
+        table = table.droplevel(0, axis=1)
+    return table.drop(columns=spec.drop).assign(Format=spec.format)
+
+
+def parse_source(source, html=None):
+    """Returns the centuries of one PlayerSource as OUTPUT_COLUMNS rows.
+
+    `html` is the player's page; players with inline rows need none. Inline
+    rows do not record not-outs."""
+    if source.rows is not None:
+        frame = pd.DataFrame(source.rows, columns=ROW_COLUMNS)
+        frame["not_out"] = False
+    else:
+        tables = pd.read_html(io.StringIO(html.decode("utf-8")))
+        frame = pd.concat(
+            [_read_table(tables, spec, source) for spec in source.tables],
+            ignore_index=True,
+        )
+        score = next(col for col in frame if source.rename.get(col, col) == "Score")
+        frame = clean_table(frame, source.clean, score=score).rename(
+            columns=source.rename
+        )
+
+    frame["country"] = source.country
+    frame["gender"] = source.gender
+    frame["name"] = source.name
+    return frame[OUTPUT_COLUMNS]
+
+
+def _parse_source(job):
+    """Process-pool entry point for parse_source."""
+    return parse_source(*job)
+
+
+class CenturyPipeline:
+    """Builds the centuries table of processed_data.xlsx from the player SOURCES.
+
+    Every page is fetched once, concurrently (at most `fetch_workers` at a
+    time), and its raw HTML is kept as a snapshot in `cache_dir`. Snapshots do
+    not expire, so parsing again never refetches; `refresh` revalidates them
+    with conditional GETs. The pages are then parsed in `workers` processes.
+
+    Parameters:
+    - sources: The PlayerSources, in output order.
+    - cache_dir: Directory of the HTML snapshots (a SnapshotCache).
+    - offline: Never touch the network; parse the snapshots alone.
+    - mirror: Base URL (e.g. "http://localhost:8000") that serves the pages
+      under their Wikipedia paths, used instead of Wikipedia.
+    """
+
+    def __init__(
+        self,
+        sources=SOURCES,
+        cache_dir=".html_cache",
+        offline=False,
+        refresh=False,
+        mirror=None,
+        fetch_workers=4,
+        workers=None,
+        tracer=None,
+    ):
+        self.sources = sources
+        self.mirror = mirror
+        self.workers = workers
+        self.tracer = tracer or NULL_TRACER
+        self.cache = SnapshotCache(cache_dir, offline=offline, refresh=refresh)
+        self.fetcher = PageFetcher(
+            max_workers=fetch_workers, cache=self.cache, tracer=tracer
+        )
+
+    def page_url(self, source):
+        """Returns the URL `source`'s page is fetched from."""
+        if self.mirror is None:
+            return source.url
+        base = urlsplit(self.mirror)
+        page = urlsplit(source.url)
+        path = base.path.rstrip("/") + page.path
+        return urlunsplit((base.scheme, base.netloc, path, page.query, ""))
+
+    def fetch(self):
+        """Returns {source url: page bytes} of every page, fetching the missing ones.
+
+        Snapshots are stored under the Wikipedia URL even when the page came from
+        the mirror, so a later offline run finds them."""
+        urls = {
+            source.url: source.url if self.cache.offline else self.page_url(source)
+            for source in self.sources
+            if source.url
+        }
+        with self.tracer.span("fetch_pages", pages=len(urls)):
+            # The session (and requests) is only set up when a page is downloaded
+            stale = [url for url in urls.values() if not self.cache.is_fresh(url)]
+            if stale and not self.cache.offline:
+                self.fetcher.session.headers["User-Agent"] = USER_AGENT
+            self.fetcher.prefetch(urls.values())
+
+        pages = {url: self.fetcher.contents[fetched] for url, fetched in urls.items()}
+        missing = [url for url, page in pages.items() if not page]
+        if missing:
+            raise RuntimeError(f"Could not fetch {', '.join(missing)}")
+
+        for url, fetched in urls.items():
+            if fetched != url:
+                self.cache.store(url, pages[url])
+        self.cache.save()
+        return pages
+
+    def parse(self, pages):
+        """Returns the centuries frame of every source, in order."""
+        jobs = [
+            (source, pages[source.url] if source.url else None)
+            for source in self.sources
+        ]
+        with self.tracer.span("parse_pages", sources=len(jobs)):
+            if not self.workers or self.workers <= 1:
+                return [parse_source(*job) for job in jobs]
+
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(_parse_source, jobs))
+
+    def build(self):
+        """Returns the centuries of every player, as processed_data.xlsx holds them."""
+        try:
+            frames = self.parse(self.fetch())
+        finally:
+            self.fetcher.close()
+        return pd.concat(frames, ignore_index=True)
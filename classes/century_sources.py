@@ -0,0 +1,465 @@
+"""
+Where the centuries in processed_data.xlsx come from, one PlayerSource per
+player in the order the players appear in the workbook.
+
+Players whose centuries are listed on Wikipedia name the page and the tables to
+read from it; the others carry their centuries inline.
+"""
+
+# Columns of processed_data.xlsx, in order
+OUTPUT_COLUMNS = [
+    "Score",
+    "Against",
+    "Venue",
+    "Date",
+    "country",
+    "gender",
+    "name",
+    "Format",
+    "not_out",
+]
+
+# Columns of the inline rows
+ROW_COLUMNS = ["Score", "Against", "Venue", "Date", "Format"]
+
+WIKIPEDIA = "https://en.wikipedia.org/wiki/"
+CENTURY_LISTS = WIKIPEDIA + "List_of_international_cricket_centuries_by_"
+
+
+class TableSpec:
+    """One table of centuries on a player's page.
+
+    - index: Position of the table among the page's tables (pd.read_html order).
+    - format: Match format of its centuries, e.g. "ODI".
+    - drop: Columns to leave out.
+    - drop_last: Leave out the last column (an unnamed references column).
+    - flatten_header: Keep only the lower row of a two-row header.
+    """
+
+    __slots__ = ("index", "format", "drop", "drop_last", "flatten_header")
+
+    def __init__(self, index, format, drop=(), drop_last=False, flatten_header=False):
+        self.index = index
+        self.format = format
+        self.drop = list(drop)
+        self.drop_last = drop_last
+        self.flatten_header = flatten_header
+
+
+class PlayerSource:
+    """Where one player's centuries come from.
+
+    - name, country, gender: Written to every row of the player.
+    - url: Page with the tables, or None for a player with inline `rows`.
+    - tables: The TableSpecs to read from the page, concatenated in order.
+    - clean: Columns to strip of footnotes and special characters.
+    - rename: {page column: output column} for pages not using OUTPUT_COLUMNS names.
+    - rows: Inline (Score, Against, Venue, Date, Format) tuples.
+    """
+
+    __slots__ = (
+        "name",
+        "country",
+        "gender",
+        "url",
+        "tables",
+        "clean",
+        "rename",
+        "rows",
+    )
+
+    def __init__(
+        self,
+        name,
+        country,
+        gender,
+        url=None,
+        tables=(),
+        clean=("Score",),
+        rename=None,
+        rows=None,
+    ):
+        self.name = name
+        self.country = country
+        self.gender = gender
+        self.url = url
+        self.tables = list(tables)
+        self.clean = list(clean)
+        self.rename = rename or {}
+        self.rows = rows
+
+
+# The player pages' tables of career centuries put opponents and years under
+# these names
+PROFILE_COLUMNS = {"Runs": "Score", "Opponents": "Against", "Year": "Date"}
+
+SOURCES = [
+    PlayerSource(
+        "Don Bradman",
+        "Australia",
+        "Male",
+        url=CENTURY_LISTS + "Don_Bradman",
+        tables=[TableSpec(3, "Test")],
+        clean=("Score", "Result"),
+    ),
+    PlayerSource(
+        "Meg Lanning",
+        "Australia",
+        "Female",
+        url=WIKIPEDIA + "Meg_Lanning",
+        tables=[
+            TableSpec(3, "T20I", drop_last=True, flatten_header=True),
+            TableSpec(4, "ODI", drop_last=True, flatten_header=True),
+        ],
+        clean=("Score", "Year"),
+        rename=PROFILE_COLUMNS,
+    ),
+    PlayerSource(
+        "Joe Root",
+        "England",
+        "Male",
+        url=CENTURY_LISTS + "Joe_Root",
+        tables=[
+            TableSpec(0, "Test", drop=("Test", "Ref")),
+            TableSpec(1, "ODI", drop=("S/R", "Ref")),
+        ],
+    ),
+    PlayerSource(
+        "Charlotte Edwards",
+        "England",
+        "Female",
+        rows=[
+            (108, "India", "Shenley", "July 1999", "Test"),
+            (117, "New Zealand", "Nottingham", "August 2004", "Test"),
+            (105, "Australia", "Worcester", "August 2005", "Test"),
+            (114, "Australia", "Sydney", "February 2008", "Test"),
+            (102, "South Africa", "Taunton", "August 1997", "ODI"),
+            (173, "Ireland", "Women's World Cup, Pune", "December 1997", "ODI"),
+            (139, "Netherlands", "Amstelveen", "July 1999", "ODI"),
+            (138, "South Africa", "Potchefstroom", "October 2011", "ODI"),
+            (137, "New Zealand", "Lincoln", "March 2012", "ODI"),
+            (109, "India", "Mumbai (Women's World Cup)", "February 2013", "ODI"),
+            (106, "New Zealand", "Mumbai (Women's World Cup)", "February 2013", "ODI"),
+            (108, "India", "Scarborough", "August 2014", "ODI"),
+            (108, "India", "Scarborough", "August 2014", "ODI"),
+        ],
+    ),
+    PlayerSource(
+        "Sachin Tendulkar",
+        "India",
+        "Male",
+        url=CENTURY_LISTS + "Sachin_Tendulkar",
+        tables=[
+            TableSpec(3, "ODI", drop=("S/R", "Ref", "H/A/N")),
+            TableSpec(2, "Test", drop=("Test", "Ref", "H/A")),
+        ],
+    ),
+    PlayerSource(
+        "Mithali Raj",
+        "India",
+        "Female",
+        rows=[
+            (214, "England", "Taunton", "August 2002", "Test"),
+            (114, "Ireland", "Milton Keynes", "June 26, 1999", "ODI"),
+            (
+                108,
+                "Sri Lanka",
+                "Karachi (Women's Asia Cup Final)",
+                "January 4, 2006",
+                "ODI",
+            ),
+            (109, "West Indies", "Rajkot", "March 1, 2011", "ODI"),
+            (103, "Pakistan", "Cuttack (Women's World Cup)", "February 7, 2013", "ODI"),
+            (104, "Sri Lanka", "Visakhapatnam", "January 19, 2014", "ODI"),
+            (109, "New Zealand", "Derby (Women's World Cup)", "July 15, 2017", "ODI"),
+            (125, "Australia", "Baroda", "March 12, 2018", "ODI"),
+        ],
+    ),
+    PlayerSource(
+        "Jacques Kallis",
+        "South Africa",
+        "Male",
+        url=CENTURY_LISTS + "Jacques_Kallis",
+        tables=[
+            TableSpec(1, "Test", drop=("Test", "Ref")),
+            TableSpec(2, "ODI", drop=("S/R", "Ref")),
+        ],
+    ),
+    PlayerSource(
+        "Laura Wolvaardt",
+        "South Africa",
+        "Female",
+        rows=[
+            (122, "India", "M.A. Chidambaram Stadium, Chennai", "July 1, 2024", "Test"),
+            (105, "Ireland", "The Village, Dublin", "August 9, 2016", "ODI"),
+            (149, "Ireland", "Senwes Park, Potchefstroom", "May 2017", "ODI"),
+            (
+                117,
+                "West Indies",
+                "Wanderers Stadium, Johannesburg",
+                "January 2022",
+                "ODI",
+            ),
+            (124, "New Zealand", "City Oval, Pietermaritzburg", "March 2023", "ODI"),
+            (126, "Bangladesh", "Willowmoore Park, Benoni", "May 2023", "ODI"),
+            (110, "Sri Lanka", "Diamond Oval, Kimberley", "March 2024", "ODI"),
+            (184, "Sri Lanka", "Diamond Oval, Kimberley", "April 2024", "ODI"),
+            (102, "Sri Lanka", "Willowmoore Park, Benoni", "March 27, 2024", "T20I"),
+        ],
+    ),
+    PlayerSource(
+        "Kane Williamson",
+        "New Zealand",
+        "Male",
+        url=CENTURY_LISTS + "Kane_Williamson",
+        tables=[
+            TableSpec(0, "Test", drop=("Test", "Ref")),
+            TableSpec(1, "ODI", drop=("S/R", "Ref")),
+        ],
+    ),
+    PlayerSource(
+        "Suzie Bates",
+        "New Zealand",
+        "Female",
+        url=WIKIPEDIA + "Suzie_Bates",
+        tables=[TableSpec(3, "ODI")],
+        clean=("Runs", "Year"),
+        rename=PROFILE_COLUMNS,
+    ),
+    PlayerSource(
+        "Brian Lara",
+        "West Indies",
+        "Male",
+        url=CENTURY_LISTS + "Brian_Lara",
+        tables=[
+            TableSpec(2, "Test", drop=("Test", "H/A")),
+            TableSpec(3, "ODI", drop=("S.R.", "H/A/N")),
+        ],
+        clean=("Score", "Result"),
+    ),
+    PlayerSource(
+        "Hayley Matthews",
+        "West Indies",
+        "Female",
+        url=WIKIPEDIA + "Hayley_Matthews",
+        tables=[TableSpec(2, "ODI"), TableSpec(3, "Test")],
+        clean=("Runs", "Year"),
+        rename=PROFILE_COLUMNS,
+    ),
+    PlayerSource(
+        "Mushfiqur Rahim",
+        "Bangladesh",
+        "Male",
+        rows=[
+            (
+                101,
+                "India",
+                "Zohur Ahmed Chowdhury Stadium, Chattogram",
+                "17 January 2010",
+                "Test",
+            ),
+            (
+                200,
+                "Sri Lanka",
+                "Galle International Stadium, Galle",
+                "8 March 2013",
+                "Test",
+            ),
+            (
+                116,
+                "West Indies",
+                "Arnos Vale Stadium, Kingstown",
+                "5 September 2014",
+                "Test",
+            ),
+            (
+                159,
+                "New Zealand",
+                "Basin Reserve, Wellington",
+                "12 January 2017",
+                "Test",
+            ),
+            (
+                127,
+                "India",
+                "Rajiv Gandhi International Stadium, Hyderabad",
+                "9 February 2017",
+                "Test",
+            ),
+            (
+                219,
+                "Zimbabwe",
+                "Sher-e-Bangla National Stadium, Dhaka",
+                "11 November 2018",
+                "Test",
+            ),
+            (
+                203,
+                "Zimbabwe",
+                "Sher-e-Bangla National Stadium, Dhaka",
+                "22 February 2020",
+                "Test",
+            ),
+            (
+                105,
+                "Sri Lanka",
+                "Zohur Ahmed Chowdhury Stadium, Chattogram",
+                "15 May 2022",
+                "Test",
+            ),
+            (
+                175,
+                "Sri Lanka",
+                "Sher-e-Bangla National Stadium, Dhaka",
+                "23 May 2022",
+                "Test",
+            ),
+            (
+                126,
+                "Ireland",
+                "Sher-e-Bangla National Stadium, Dhaka",
+                "4 April 2023",
+                "Test",
+            ),
+            (
+                191,
+                "Pakistan",
+                "Rawalpindi Cricket Stadium, Rawalpindi",
+                "21 August 2024",
+                "Test",
+            ),
+            (101, "Zimbabwe", "Harare Sports Club, Harare", "16 August 2011", "ODI"),
+            (
+                117,
+                "India",
+                "Khan Shaheb Osman Ali Stadium, Fatullah",
+                "26 February 2014",
+                "ODI",
+            ),
+            (
+                106,
+                "Pakistan",
+                "Sher-e-Bangla National Cricket Stadium, Dhaka",
+                "17 April 2015",
+                "ODI",
+            ),
+            (
+                107,
+                "Zimbabwe",
+                "Sher-e-Bangla National Cricket Stadium, Dhaka",
+                "7 November 2015",
+                "ODI",
+            ),
+            (
+                110,
+                "South Africa",
+                "De Beers Diamond Oval, Kimberly",
+                "15 October 2017",
+                "ODI",
+            ),
+            (
+                144,
+                "Sri Lanka",
+                "Dubai International Cricket Stadium, Dubai",
+                "15 September 2018",
+                "ODI",
+            ),
+            (102, "Australia", "Trent Bridge, Nottingham", "20 June 2019", "ODI"),
+            (
+                125,
+                "Sri Lanka",
+                "Sher-e-Bangla National Cricket Stadium, Dhaka",
+                "25 May 2021",
+                "ODI",
+            ),
+            (
+                100,
+                "Ireland",
+                "Sylhet International Cricket Stadium, Sylhet",
+                "20 March 2023",
+                "ODI",
+            ),
+        ],
+    ),
+    PlayerSource(
+        "Fargana Hoque",
+        "Bangladesh",
+        "Female",
+        rows=[
+            (110, "Maldives", "South Asian Games 2019", "December 2019", "T20I"),
+            (
+                107,
+                "India",
+                "Bangladesh vs India Women's ODI Series 2023",
+                "July 22, 2023",
+                "ODI",
+            ),
+        ],
+    ),
+    PlayerSource(
+        "Kumar Sangakkara",
+        "Sri Lanka",
+        "Male",
+        url=CENTURY_LISTS + "Kumar_Sangakkara",
+        tables=[
+            TableSpec(2, "ODI", drop=("SR", "Ref")),
+            TableSpec(1, "Test", drop=("Test", "Ref")),
+        ],
+    ),
+    PlayerSource(
+        "Chamari Athapaththu",
+        "Sri Lanka",
+        "Female",
+        url=WIKIPEDIA + "Chamari_Athapaththu",
+        tables=[
+            TableSpec(5, "T20T", drop_last=True, flatten_header=True),
+            TableSpec(4, "ODI", drop_last=True, flatten_header=True),
+        ],
+        clean=("Runs", "Year"),
+        rename=dict(PROFILE_COLUMNS, Ground="Venue"),
+    ),
+    PlayerSource(
+        "Inzamam-ul-Haq",
+        "Pakistan",
+        "Male",
+        url=CENTURY_LISTS + "Inzamam-ul-Haq",
+        tables=[
+            TableSpec(2, "ODI", drop=("S/R", "Ref")),
+            TableSpec(1, "Test", drop=("S/R", "Ref")),
+        ],
+    ),
+    PlayerSource(
+        "Javeria Khan",
+        "Pakistan",
+        "Female",
+        rows=[
+            (133, "Sri Lanka", "Sharjah Cricket Stadium", "2015-03-11", "ODI"),
+            (113, "Sri Lanka", "Dambulla", "2018-03-20", "ODI"),
+        ],
+    ),
+    PlayerSource(
+        "Paul Stirling",
+        "Ireland",
+        "Male",
+        rows=[
+            (177, "Canada", "Toronto", "2010-09-07", "ODI"),
+            (101, "Netherlands", "Kolkata", "2011-03-18", "ODI"),
+            (109, "Pakistan", "Belfast", "2011-05-30", "ODI"),
+            (142, "England", "Southampton", "2020-08-04", "ODI"),
+            (131, "UAE", "Abu Dhabi", "2021-01-10", "ODI"),
+            (128, "Afghanistan", "Abu Dhabi", "2021-01-24", "ODI"),
+            (118, "Afghanistan", "Abu Dhabi", "2021-01-26", "ODI"),
+            (115, "Zimbabwe", "Bready", "2021-09-01", "T20I"),
+            (103, "Sri Lanka", "Galle", "2023-04-25", "Test"),
+        ],
+    ),
+    PlayerSource(
+        "Gaby Lewis",
+        "Ireland",
+        "Female",
+        rows=[
+            (105, "Germany", "La Manga", "2021-08-26", "WT20I"),
+            (119, "Sri Lanka", "Colombo", "2024-08-13", "WT20I"),
+        ],
+    ),
+]
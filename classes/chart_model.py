@@ -0,0 +1,85 @@
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+# Points of the smoothed trend line in the PNG and HTML charts
+TREND_POINTS = 300
+
+
+class ChartModel:
+    """The series one player's charts are drawn from, shared by every renderer.
+
+    - dates: Year of each century, in bar order.
+    - scores: Score of each century.
+    - trend: (x, y) arrays of the smoothed trend line, or None with fewer than
+      three centuries.
+    """
+
+    __slots__ = ("dates", "scores", "trend")
+
+    def __init__(self, dates, scores, trend):
+        self.dates = dates
+        self.scores = scores
+        self.trend = trend
+
+    @property
+    def x(self):
+        """Position of each bar and point."""
+        return np.arange(len(self.scores))
+
+    @property
+    def labels(self):
+        """Year labels of the bars."""
+        return [str(date) for date in self.dates]
+
+
+@lru_cache(maxsize=256)
+def _spline_basis(n, points):
+    """Returns the trend's x values and the (points, n) matrix that maps n scores to it.
+
+    Spline interpolation is linear in the data, so interpolating the identity
+    gives the weight of every score at every trend point; a player's trend is
+    then one matrix product, and all players with n centuries share one basis."""
+    from scipy.interpolate import make_interp_spline
+
+    x_smooth = np.linspace(0, n - 1, points)
+    # Cubic spline interpolation (quadratic when there are only 3 points)
+    basis = make_interp_spline(np.arange(n), np.eye(n), k=min(3, n - 1))(x_smooth)
+    return x_smooth, basis
+
+
+def spline_trend(scores, points=TREND_POINTS):
+    """Returns the (x, y) trend line through `scores`, or None for fewer than 3 scores."""
+    if len(scores) <= 2:
+        return None
+    x_smooth, basis = _spline_basis(len(scores), points)
+    return x_smooth, basis @ np.asarray(scores, dtype=float)
+
+
+def chart_models(frames, points=TREND_POINTS):
+    """Returns the ChartModel of each player frame (sorted by `date`), in order.
+
+    Players are grouped by their number of centuries, and the trends of each
+    group are computed in one matrix product."""
+    dates = [frame["date"].tolist() for frame in frames]
+    scores = [frame["Score"].tolist() for frame in frames]
+
+    groups = defaultdict(list)
+    for idx, player_scores in enumerate(scores):
+        if len(player_scores) > 2:
+            groups[len(player_scores)].append(idx)
+
+    trends = [None] * len(frames)
+    for n, indices in groups.items():
+        x_smooth, basis = _spline_basis(n, points)
+        smoothed = basis @ np.array([scores[idx] for idx in indices], dtype=float).T
+        for column, idx in enumerate(indices):
+            trends[idx] = (x_smooth, smoothed[:, column])
+
+    return [ChartModel(*model) for model in zip(dates, scores, trends)]
+
+
+def chart_model(frame, points=TREND_POINTS):
+    """Returns the ChartModel of one player frame."""
+    return chart_models([frame], points)[0]
@@ -0,0 +1,211 @@
+import os
+
+import numpy as np
+import matplotlib
+import matplotlib.ticker as mticker
+from matplotlib import font_manager
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+
+BAR_WIDTH = 0.8
+
+
+def prewarm_fonts():
+    """Builds matplotlib's font list cache and resolves the fonts the charts use.
+
+    Importing font_manager scans the system fonts only when its cache in the
+    matplotlib config directory is missing, so running this once per environment
+    (e.g. while building an image) keeps that scan out of every later run."""
+    for weight in ("normal", "bold"):
+        font_manager.findfont(font_manager.FontProperties(weight=weight))
+    return matplotlib.get_cachedir()
+
+
+class TextBatch(Artist):
+    """Draws many strings that share one style as a single artist.
+
+    One Text template is moved and re-labelled for each string at draw time, so
+    the figure holds one artist no matter how many labels a chart has."""
+
+    def __init__(self, **text_kwargs):
+        super().__init__()
+        self._template = Text(**text_kwargs)
+        self.set_zorder(self._template.get_zorder())  # Above the bars, like plt.text
+        self._positions = []
+        self._labels = []
+
+    def set_data(self, positions, labels):
+        self._positions = positions
+        self._labels = labels
+        self.stale = True
+
+    def set_figure(self, fig):
+        super().set_figure(fig)
+        self._template.set_figure(fig)
+
+    def set_transform(self, t):
+        super().set_transform(t)
+        self._template.set_transform(t)
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        for position, label in zip(self._positions, self._labels):
+            self._template.set_position(position)
+            self._template.set_text(label)
+            self._template.draw(renderer)
+        self.stale = False
+
+
+class MatplotlibChartRenderer:
+    """Renders a player's bar and scatter PNGs on two pooled figures.
+
+    Each chart type gets one Figure/Axes, built on first use with a fixed layout.
+    Later players only update the bar polygons, scatter offsets, trend line and
+    the batched labels in place, so render time and memory stay flat however
+    many players are drawn. The figures are not registered with pyplot, so
+    nothing is left open between players.
+    """
+
+    def __init__(self, style):
+        self.style = style
+        self._bar = None
+        self._scatter = None
+
+    def _new_figure(self):
+        fig = Figure(figsize=self.style["figsize"])
+        FigureCanvasAgg(fig)
+        fig.subplots_adjust(**self.style["margins"])
+        ax = fig.add_subplot()
+        ax.set_xticks([])  # Remove x-axis labels
+        ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
+        return fig, ax
+
+    def _bar_chart(self):
+        if self._bar is None:
+            fig, ax = self._new_figure()
+            ax.set_ylabel("Runs Scored")
+            ax.set_title(self.style["bar_title"])
+
+            bars = PolyCollection(
+                [], facecolors=self.style["bar_color"], edgecolors="none"
+            )
+            ax.add_collection(bars)
+
+            # Score on top of each bar
+            scores = TextBatch(
+                ha="center",
+                va="bottom",
+                fontsize=12,
+                fontweight="bold",
+                color=self.style["bar_color"],
+            )
+            # Year inside each bar (rotated, at bottom)
+            years = TextBatch(
+                ha="center", va="bottom", fontsize=12, color="white", rotation=90
+            )
+            for batch in (scores, years):
+                ax.add_artist(batch)
+                batch.set_transform(ax.transData)
+
+            self._bar = (fig, ax, bars, scores, years)
+        return self._bar
+
+    def _scatter_chart(self):
+        if self._scatter is None:
+            fig, ax = self._new_figure()
+            ax.set_ylabel("Total Centuries")
+            ax.set_title(self.style["scatter_title"])
+
+            points = ax.scatter(
+                [],
+                [],
+                color=self.style["scatter_color"],
+                label="Scores",
+                s=100,
+                edgecolors="black",
+            )
+            (trend,) = ax.plot(
+                [],
+                [],
+                color=self.style["trend_color"],
+                linestyle="--",
+                linewidth=2,
+                label="Trend Line",
+            )
+
+            self._scatter = (fig, ax, points, trend)
+        return self._scatter
+
+    def render_bar(self, chart, filename):
+        """Draws one bar per century of a ChartModel, annotated with its score and year."""
+        fig, ax, bars, score_labels, year_labels = self._bar_chart()
+        scores = chart.scores
+        x = chart.x
+        heights = np.asarray(scores, dtype=float)
+
+        left = x - BAR_WIDTH / 2
+        right = x + BAR_WIDTH / 2
+        zeros = np.zeros_like(heights)
+        bars.set_verts(
+            np.stack(
+                [
+                    np.column_stack([left, zeros]),
+                    np.column_stack([left, heights]),
+                    np.column_stack([right, heights]),
+                    np.column_stack([right, zeros]),
+                ],
+                axis=1,
+            )
+        )
+        score_labels.set_data(
+            list(zip(x, heights + 0.5)), [str(score) for score in scores]
+        )
+        year_labels.set_data(list(zip(x, heights * 0.1)), chart.labels)
+
+        ax.set_xlim(-0.5, len(scores) - 0.5)  # Remove extra padding
+        ax.set_ylim(0, heights.max() * 1.05 if len(heights) else 1)
+
+        self._save(fig, filename)
+
+    def render_scatter(self, chart, filename):
+        """Draws every century of a ChartModel as a point plus its trend line."""
+        fig, ax, points, trend = self._scatter_chart()
+        scores = chart.scores
+        y = np.asarray(scores, dtype=float)
+        points.set_offsets(np.column_stack([chart.x, y]))
+
+        handles = [points]
+        limits = [y]
+        if chart.trend is not None:
+            x_smooth, y_smooth = chart.trend
+            trend.set_data(x_smooth, y_smooth)
+            trend.set_visible(True)
+            handles.append(trend)
+            limits.append(y_smooth)
+        else:
+            trend.set_visible(False)
+
+        # Same 5% margins matplotlib's autoscaling would add
+        values = np.concatenate(limits)
+        if len(values):
+            low, high = values.min(), values.max()
+            pad = (high - low) * 0.05 or 0.05 * abs(high) or 1
+            ax.set_ylim(low - pad, high + pad)
+        ax.set_xlim(-0.5, len(scores) - 0.5)  # Remove extra padding
+        ax.legend(handles=handles)
+
+        self._save(fig, filename)
+
+    def _save(self, fig, filename):
+        # Ensure directory exists before saving
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        fig.savefig(filename)
+
+    def close(self):
+        """Drops the pooled figures."""
+        self._bar = None
+        self._scatter = None
@@ -1,23 +1,95 @@
+import copy
+import json
 import random
+import re
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
-import pandas as pd
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml.ns import qn
+from pptx.oxml.simpletypes import ST_Angle
 from pptx.oxml.xmlchemy import OxmlElement
-import requests
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from io import BytesIO
+from deck_writer import StreamingDeckWriter
+from decoration_band import render_band
+from image_fetcher import ImageFetcher
+from image_preparer import ImagePreparer
+from native_charts import add_bar_chart, add_scatter_chart
+from player_stats import player_stats
+from table_writer import AGGREGATE_TABLE_STYLE, SCORE_TABLE_STYLE, table_graphic_frame
+
+# "boxes" adds random text boxes to every slide, "band" one shared image per deck
+DECORATION_MODES = ("boxes", "band")
+# "png" places the rendered chart images, "native" builds PowerPoint charts instead
+CHART_BACKENDS = ("png", "native")
+
+# Namespace of the r:embed / r:link / r:id attributes that point at relationships
+REL_ATTRIBUTE_PREFIX = qn("r:id").rpartition("}")[0] + "}"
+
+# (column, fallback text, top, right) of the single-cell tables on each info slide
+INFO_TABLES = [
+    ("DOB", "Unknown", Inches(1), Inches(5)),
+    ("Birth Place", "Unknown", Inches(1), Inches(2)),
+    ("Mother", "No Data", Inches(2), Inches(5)),
+    ("Father", "No Data", Inches(2), Inches(2)),
+    ("Height", "No Data", Inches(3), Inches(5)),
+    ("Marital Status", "No Data", Inches(3), Inches(2)),
+    ("Retired", "No Data", Inches(4), Inches(3.5)),
+]
 
 
 class CustomPresentation:
-    def __init__(self, key, name):
-        self.prs = Presentation()
+    def __init__(
+        self,
+        key,
+        name,
+        image_fetcher=None,
+        path=None,
+        decoration="boxes",
+        decoration_seed=0,
+        stream=False,
+        image_preparer=None,
+        chart_backend="png",
+        chart_style=None,
+    ):
+        """Starts a new deck, or opens the deck previously generated at `path`.
+
+        `decoration` is one of DECORATION_MODES; `decoration_seed` seeds the band.
+        With `stream`, finished slides are written out on each flush() instead of
+        being held until save(); streamed slides can no longer be changed.
+        `chart_backend` is one of CHART_BACKENDS; native charts take their titles
+        and colours from `chart_style` (the generator's CHART_STYLE)."""
+        if stream and path is not None:
+            raise ValueError("stream only applies to new decks, not to updating one")
+
+        self.prs = Presentation(path)
         self.key = key
         self.name = name
+        self.image_fetcher = image_fetcher or ImageFetcher()
+        self.image_preparer = image_preparer or ImagePreparer()
+        # Prototype shapes shared by every player's slides, see _stamp_shapes
+        self._templates = {}
+        self.decoration = decoration
+        self.decoration_seed = decoration_seed
+        self.chart_backend = chart_backend
+        self.chart_style = chart_style
+        # Rendered band per (boundary, n), see _add_decoration
+        self._bands = {}
+        # Slides added since the last flush(), when streaming
+        self.writer = StreamingDeckWriter() if stream else None
+        self._pending_slides = []
+        # Slide id element per slide part and whether slides were removed, see
+        # remove_slide and _renumber_slides
+        self._slide_ids = None
+        self._needs_renumber = False
 
         self._configure_presentation()
 
+        if path is None:
+            self._add_intro_slide()
+
     def _configure_presentation(self):
         """Configures the presentation dimensions and layout."""
         self.prs.slide_width = Inches(15)
@@ -41,11 +113,10 @@ class CustomPresentation:
         # Logo Paths
         self.logo = "assets/logo.png"
 
-        self._add_intro_slide()
-
     def _add_intro_slide(self):
         """Adds an introduction slide."""
         slide = self._get_new_slide()
+        self._tag_slide(slide, "intro")
 
         # Apply a gradient background from top left (dark blue) to bottom right (turquoise)
         self._add_gradient(slide)
@@ -94,6 +165,7 @@ class CustomPresentation:
     def add_end_slide(self):
         """Adds End slide."""
         slide = self._get_new_slide()
+        self._tag_slide(slide, "end")
         self._add_gradient(slide)
 
         # Load the white logo image
@@ -125,7 +197,20 @@ class CustomPresentation:
         stop_2.position = 1  # Position at the end (bottom right)
         stop_2.color.rgb = RGBColor(0, 137, 196)  # Turquoise
 
+    def _renumber_slides(self):
+        """Renames the slide parts after the slide order if slides were removed.
+
+        A new slide takes the partname after the slide count, which could still
+        be a remaining slide's; renumbering once for all the removals keeps
+        patching a deck proportional to the changed slides."""
+        if not self._needs_renumber:
+            return
+        rIds = [sldId.rId for sldId in self.prs.slides._sldIdLst]
+        self.prs.part.rename_slide_parts(rIds)
+        self._needs_renumber = False
+
     def _get_new_slide(self):
+        self._renumber_slides()
         slide = self.prs.slides.add_slide(self.slide_layout)
 
         if slide.shapes.title:
@@ -133,8 +218,179 @@ class CustomPresentation:
             sp = slide.shapes.title
             slide.shapes._spTree.remove(sp._element)
 
+        if self.writer is not None:
+            self._pending_slides.append(slide)
         return slide
 
+    def _tag_slide(self, slide, kind, player=None, digest=None):
+        """Stores a stable identifier in the slide name so update runs can find it again.
+
+        `digest` identifies the input data the slide was built from."""
+        slide._element.cSld.name = json.dumps(
+            {"kind": kind, "player": player, "digest": digest}
+        )
+
+    def _slide_tag(self, slide):
+        """Returns the identifier stored by _tag_slide, or None for untagged slides."""
+        try:
+            tag = json.loads(slide._element.cSld.name)
+        except ValueError:
+            return None
+        return tag if isinstance(tag, dict) else None
+
+    def find_slides(self, kind):
+        """Returns the slides tagged with `kind`, in deck order."""
+        return [
+            slide
+            for slide in self.prs.slides
+            if (self._slide_tag(slide) or {}).get("kind") == kind
+        ]
+
+    def player_slides(self):
+        """Maps each player in the deck to the digest and slides stored for them.
+
+        The digest is None unless the player has both slides built from the same data."""
+        slides = {}
+        for slide in self.prs.slides:
+            tag = self._slide_tag(slide)
+            if tag is not None and tag["player"] is not None:
+                slides.setdefault(tag["player"], []).append((tag, slide))
+
+        players = {}
+        for player, tagged in slides.items():
+            digests = {tag["digest"] for tag, _ in tagged}
+            kinds = sorted(tag["kind"] for tag, _ in tagged)
+            players[player] = {
+                "digest": digests.pop()
+                if len(digests) == 1 and kinds == ["chart", "info"]
+                else None,
+                "slides": [slide for _, slide in tagged],
+            }
+        return players
+
+    def remove_slide(self, slide):
+        """Removes a slide; its now unreferenced parts are dropped on save.
+
+        The remaining slides are renumbered before the next new slide or save."""
+        if self._slide_ids is None or slide.part not in self._slide_ids:
+            # One pass over the deck, reused by the removals that follow
+            self._slide_ids = {
+                self.prs.part.related_part(sldId.rId): sldId
+                for sldId in self.prs.slides._sldIdLst
+            }
+        sldId = self._slide_ids.pop(slide.part, None)
+        if sldId is None:
+            return
+        self.prs.slides._sldIdLst.remove(sldId)
+        # The slide id was the only reference to the relationship; drop_rel would
+        # search the whole presentation part to confirm it
+        self.prs.part.rels.pop(sldId.rId)
+        self._needs_renumber = True
+
+    def arrange_slides(self, players):
+        """Orders the deck as intro, aggregate, each player's info and chart slides, end.
+
+        Untagged slides keep their relative order just before the end slide."""
+        order = {("intro", None): 0, ("aggregate", None): 1}
+        for player in players:
+            order[("info", player)] = len(order)
+            order[("chart", player)] = len(order)
+        untagged_rank = len(order)
+        order[("end", None)] = len(order) + 1
+
+        sldIdLst = self.prs.slides._sldIdLst
+        entries = list(zip(self.prs.slides, list(sldIdLst)))
+
+        def rank(entry):
+            tag = self._slide_tag(entry[0]) or {}
+            return order.get((tag.get("kind"), tag.get("player")), untagged_rank)
+
+        for _, sldId in entries:
+            sldIdLst.remove(sldId)
+        for _, sldId in sorted(entries, key=rank):
+            sldIdLst.append(sldId)
+
+    def _stamp_shapes(self, slide, name, build, bind_rels=True, copies=1):
+        """Adds `copies` of the shapes of template `name` to a slide and returns their elements.
+
+        The first call runs `build(slide)` and keeps a copy of the shapes it added
+        as the prototype. Later copies are deep copies of the prototype instead of
+        shapes built again, which is much cheaper than the python-pptx object API.
+        With `bind_rels` the copies use the same images and links as the
+        prototype; otherwise the caller sets every relationship itself."""
+        spTree = slide.shapes._spTree
+        elements = []
+        if name not in self._templates:
+            count = len(spTree.xpath("./p:sp|./p:pic|./p:graphicFrame"))
+            build(slide)
+            elements = spTree.xpath("./p:sp|./p:pic|./p:graphicFrame")[count:]
+            rels = {}
+            for element in elements:
+                for owner, attribute in self._rel_attributes(element):
+                    rel = slide.part.rels[owner.get(attribute)]
+                    target = rel.target_ref if rel.is_external else rel.target_part
+                    rels[owner.get(attribute)] = (target, rel.reltype, rel.is_external)
+            self._templates[name] = ([copy.deepcopy(e) for e in elements], rels)
+            copies -= 1
+
+        prototypes, rels = self._templates[name]
+        next_id = spTree.max_shape_id + 1
+        for _ in range(copies):
+            for prototype in prototypes:
+                element = copy.deepcopy(prototype)
+                for cNvPr in element.xpath(".//p:cNvPr"):
+                    # Same id and "<Kind> <id - 1>" name python-pptx gives a new shape
+                    cNvPr.set("id", str(next_id))
+                    cNvPr.set(
+                        "name", re.sub(r"\d+$", str(next_id - 1), cNvPr.get("name"))
+                    )
+                    next_id += 1
+                if bind_rels and rels:
+                    for owner, attribute in self._rel_attributes(element):
+                        owner.set(
+                            attribute, slide.part.relate_to(*rels[owner.get(attribute)])
+                        )
+                spTree.insert_element_before(element, "p:extLst")
+                elements.append(element)
+        return elements
+
+    def _rel_attributes(self, element):
+        """Yields (element, attribute) for every relationship reference under `element`."""
+        for owner in element.iter():
+            for attribute in owner.attrib:
+                if attribute.startswith(REL_ATTRIBUTE_PREFIX):
+                    yield owner, attribute
+
+    def _fill_text(self, sp, text):
+        """Replaces the text of a text box stamped from a template, keeping its style."""
+        p = sp.txBody.p_lst[0]
+        for child in p.content_children:
+            p.remove(child)
+        p.append_text(text)
+
+    def _fill_cell(self, graphic_frame, row_idx, col_idx, text):
+        """Sets a cell of a table stamped from a template the way `cell.text` does."""
+        tc = graphic_frame.xpath(".//a:tr")[row_idx].xpath("./a:tc")[col_idx]
+        for p in tc.txBody.p_lst[1:]:
+            tc.txBody.remove(p)
+        lines = text.split("\n")
+        self._fill_text(tc, lines[0])
+        for line in lines[1:]:
+            tc.txBody.add_p().append_text(line)
+
+    def _stamp_ribbon(self, slide, slide_name, country):
+        """Adds the player name and country boxes at the top of a player slide."""
+        name_box, country_box = self._stamp_shapes(
+            slide,
+            "ribbon",
+            lambda s: self._add_top_text_boxes(s, slide_name, country),
+        )
+        self._fill_text(name_box, slide_name)
+        self._fill_text(country_box, ", ".join(country))
+
+    def _stamp_logo(self, slide):
+        self._stamp_shapes(slide, "logo", lambda s: self._add_slide_logo(s, self.logo))
+
     def SubElement(self, parent, tagname, **kwargs):
         element = OxmlElement(tagname)
         element.attrib.update(kwargs)
@@ -292,41 +548,45 @@ class CustomPresentation:
         border_width=Pt(3),
     ):
         """
-        Downloads an image from a URL and places it on the left with cover-style scaling and a border.
+        Places the image at a URL on the left with cover-style scaling and a border.
+
+        The bytes come from the presentation's ImageFetcher, which serves prefetched
+        images from memory and downloads anything it has not seen yet. The
+        ImagePreparer crops them to the box and scales them down to its size.
         """
+        content = self.image_fetcher.get(image_url)
+        if content is None:
+            return
+        content = self.image_preparer.prepare(content, width, height)
+
+        image_stream = BytesIO(content)
+
+        # Add a border frame
+        frame = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
+        frame.fill.solid()
+        frame.fill.fore_color.rgb = RGBColor(255, 255, 255)
+        frame.fill.transparency = 1
+        frame.line.color.rgb = border_color
+        frame.line.width = border_width
+
+        # Add the image on top (same position and size)
         try:
-            response = requests.get(image_url)
-            if response.status_code == 200:
-                image_stream = BytesIO(response.content)
-
-                # Add a border frame
-                frame = slide.shapes.add_shape(
-                    MSO_SHAPE.RECTANGLE, left, top, width, height
-                )
-                frame.fill.solid()
-                frame.fill.fore_color.rgb = RGBColor(255, 255, 255)
-                frame.fill.transparency = 1
-                frame.line.color.rgb = border_color
-                frame.line.width = border_width
-
-                # Add the image on top (same position and size)
-                slide.shapes.add_picture(
-                    image_stream, left, top, width=width, height=height
-                )
-            else:
-                print(f"Failed to download image from {image_url}")
+            slide.shapes.add_picture(
+                image_stream, left, top, width=width, height=height
+            )
         except Exception as e:
-            print(f"Error downloading image: {e}")
+            print(f"Error adding image from {image_url}: {e}")
 
-    def add_player_info(self, slide_name, personal_info, total_cen):
+    def add_player_info(self, slide_name, personal_info, total_cen, digest=None):
         country = personal_info["Country"].unique()
         image = personal_info["Image"].unique()[0]
         flag = personal_info["Flag"].unique()[0]
 
         slide = self._get_new_slide()
+        self._tag_slide(slide, "info", slide_name, digest)
         boundary = (Inches(-2), Inches(8), Inches(15), Inches(9))
-        self._add_random_boxes(slide, boundary, 100)
-        self._add_top_text_boxes(slide, slide_name, country)
+        self._add_decoration(slide, boundary, 100)
+        self._stamp_ribbon(slide, slide_name, country)
         self.add_player_image_from_url(slide, image)
         self.add_player_image_from_url(
             slide,
@@ -337,143 +597,29 @@ class CustomPresentation:
             height=Inches(1),
         )
 
-        dob_data = pd.DataFrame(
-            [
-                {
-                    "DOB": personal_info["DOB"].unique()[0]
-                    if len(personal_info["DOB"].unique())
-                    else "Unknown"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            dob_data,
-            Inches(2),
-            top=Inches(1),
-            right=Inches(5),
-        )
+        values = []
+        for column, fallback, _, _ in INFO_TABLES:
+            unique = personal_info[column].unique()
+            values.append(str(unique[0]) if len(unique) else fallback)
+        values.append(str(total_cen))
 
-        birth_place = pd.DataFrame(
-            [
-                {
-                    "Birth Place": personal_info["Birth Place"].unique()[0]
-                    if len(personal_info["Birth Place"].unique())
-                    else "Unknown"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            birth_place,
-            Inches(2),
-            top=Inches(1),
-            right=Inches(2),
-        )
-
-        mother = pd.DataFrame(
-            [
-                {
-                    "Mother": personal_info["Mother"].unique()[0]
-                    if len(personal_info["Mother"].unique())
-                    else "No Data"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            mother,
-            Inches(2),
-            top=Inches(2),
-            right=Inches(5),
-        )
-
-        father = pd.DataFrame(
-            [
-                {
-                    "Father": personal_info["Father"].unique()[0]
-                    if len(personal_info["Father"].unique())
-                    else "No Data"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            father,
-            Inches(2),
-            top=Inches(2),
-            right=Inches(2),
-        )
-
-        height = pd.DataFrame(
-            [
-                {
-                    "Height": personal_info["Height"].unique()[0]
-                    if len(personal_info["Height"].unique())
-                    else "No Data"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            height,
-            Inches(2),
-            top=Inches(3),
-            right=Inches(5),
-        )
-
-        married = pd.DataFrame(
-            [
-                {
-                    "Marital Status": personal_info["Marital Status"].unique()[0]
-                    if len(personal_info["Marital Status"].unique())
-                    else "No Data"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            married,
-            Inches(2),
-            top=Inches(3),
-            right=Inches(2),
-        )
-
-        retired = pd.DataFrame(
-            [
-                {
-                    "Retired": personal_info["Retired"].unique()[0]
-                    if len(personal_info["Retired"].unique())
-                    else "No Data"
-                }
-            ]
-        )
-
-        self._add_score_table(
-            slide,
-            retired,
-            Inches(2),
-            top=Inches(4),
-            right=Inches(3.5),
-        )
-
-        total_cen = pd.DataFrame([{"Total Centuries": total_cen}])
+        def build_tables(slide):
+            for (column, _, top, right), value in zip(INFO_TABLES, values):
+                self._add_columns_table(slide, [column], [[value]], Inches(2), top, right)
+            self._add_columns_table(
+                slide,
+                ["Total Centuries"],
+                [[total_cen]],
+                Inches(2),
+                top=Inches(5),
+                right=Inches(3.5),
+            )
 
-        self._add_score_table(
-            slide,
-            total_cen,
-            Inches(2),
-            top=Inches(5),
-            right=Inches(3.5),
-        )
+        tables = self._stamp_shapes(slide, "info_tables", build_tables)
+        for table, value in zip(tables, values):
+            self._fill_cell(table, 1, 0, value)
 
-        self._add_slide_logo(slide, self.logo)
+        self._stamp_logo(slide)
 
     def add_slide(
         self,
@@ -481,33 +627,36 @@ class CustomPresentation:
         img_paths,
         player_df,
         html_graph_filename="",
+        digest=None,
+        stats=None,
     ):
-        country = player_df["country"].unique()
-        score_data = (
-            player_df.groupby("date", as_index=False)["Score"]
-            .count()
-            .rename(columns={"date": "Year", "Score": "Centuries"})
-            .sort_values(by="Year", ascending=True)
-            .reset_index(drop=True)
-        )
-        max_score_data = player_df[player_df["Score"] == player_df["Score"].max()][
-            ["date", "Score"]
-        ].rename(columns={"date": "Top Year", "Score": "Top Run"})
+        """Adds a new slide with images and optional table.
 
-        """Adds a new slide with images and optional table."""
-        # Check if a table slide needs to be added
+        `stats` is the player's PlayerStats; it is computed from `player_df` when
+        it is not given."""
+        if stats is None:
+            stats = player_stats([player_df], [slide_name])[0]
 
         # Add the main slide with images
         slide = self._get_new_slide()
+        self._tag_slide(slide, "chart", slide_name, digest)
 
-        self._add_top_text_boxes(slide, slide_name, country)
+        self._stamp_ribbon(slide, slide_name, stats.countries)
 
-        self._add_slide_logo(slide, self.logo)
-        self._add_images(slide, img_paths, html_graph_filename)
-        prev_height = self._add_score_table(slide, score_data, Inches(2), top=Inches(1))
-        self._add_score_table(
+        self._stamp_logo(slide)
+        if self.chart_backend == "native":
+            self._add_native_charts(slide, player_df, html_graph_filename)
+        else:
+            self._stamp_images(slide, img_paths, html_graph_filename)
+        header, columns = stats.score_table()
+        prev_height = self._add_columns_table(
+            slide, header, columns, Inches(2), top=Inches(1)
+        )
+        header, columns = stats.top_table()
+        self._add_columns_table(
             slide,
-            max_score_data,
+            header,
+            columns,
             Inches(2),
             top=Inches(prev_height + 1),
         )
@@ -515,35 +664,57 @@ class CustomPresentation:
     def _add_score_table(
         self, slide, score_data, width, top=Inches(1.25), right=Inches(0.3)
     ):
-        table_width = width
+        # .values holds the same values and dtypes iterrows() would yield
+        values = score_data.values
+        return self._add_columns_table(
+            slide,
+            list(score_data.columns),
+            [values[:, col_idx] for col_idx in range(values.shape[1])],
+            width,
+            top,
+            right,
+        )
 
-        left = self.prs.slide_width - right - table_width
+    def _add_columns_table(
+        self, slide, header, columns, width, top=Inches(1.25), right=Inches(0.3)
+    ):
+        """Adds a score-styled table of `columns` (one value sequence per column)."""
+        left = self.prs.slide_width - right - width
 
-        rows, cols = score_data.shape
+        rows = len(columns[0]) if columns else 0
         table_height = 0.3 * (rows + 1)
-        shape = slide.shapes.add_table(
-            rows + 1, cols, left, top, table_width, Inches(0.2 * (rows + 1))
+        self._add_table(
+            slide,
+            left,
+            top,
+            width,
+            Inches(0.2 * (rows + 1)),
+            header,
+            columns,
+            SCORE_TABLE_STYLE,
         )
 
-        tbl = shape._element.graphic.graphicData.tbl
-        style_id = "{69012ECD-51FC-41F1-AA8D-1B2483CD663E}"
-        tbl[0][-1].text = style_id
-
-        table = shape.table
-
-        for col_idx, column_name in enumerate(score_data.columns):
-            cell = table.cell(0, col_idx)
-            cell.text = column_name
-            cell.text_frame.paragraphs[0].font.size = Pt(12)
-
-        for row_idx, (index, row) in enumerate(score_data.iterrows(), start=1):
-            for col_idx, value in enumerate(row):
-                cell = table.cell(row_idx, col_idx)
-                cell.text = str(value)
-                cell.text_frame.paragraphs[0].font.size = Pt(11)
-
         return table_height
 
+    def _add_table(
+        self, slide, left, top, width, height, header, columns, style, merged_header=None
+    ):
+        """Adds a table written in one pass by table_writer and returns its element."""
+        spTree = slide.shapes._spTree
+        graphic_frame = table_graphic_frame(
+            spTree.max_shape_id + 1,
+            left,
+            top,
+            width,
+            height,
+            header,
+            columns,
+            style,
+            merged_header,
+        )
+        spTree.insert_element_before(graphic_frame, "p:extLst")
+        return graphic_frame
+
     def _add_slide_logo(self, slide, logoPath, on_top=False):
         """Adds a logo to the top right corner of the slide"""
         top = Inches(0.2) if not on_top else Inches(0)
@@ -567,65 +738,158 @@ class CustomPresentation:
                 img_path, left, top, width=self.img_width, height=self.img_height
             )
 
-            # Add a transparent shape on top of the image to serve as the clickable link
-            hyperlink_shape = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE, left, top, self.img_width, self.img_height
-            )
-
-            blueBoxFill = hyperlink_shape.fill
-            blueBoxFill.solid()
-            blueBoxFillColour = blueBoxFill.fore_color
-            blueBoxFillColour.rgb = RGBColor(255, 255, 255)
-            self._set_shape_transparency(hyperlink_shape, 1000)
-            hyperlink_shape.line.color.rgb = RGBColor(255, 255, 255)
-
-            # Create a hyperlink to the html graph file
-            hyperlink_shape.click_action.hyperlink.address = html_graph_filename
+            self._add_link_overlay(slide, left, top, html_graph_filename)
 
             # Position next image below the first
             top += self.img_height
 
-    def _add_random_boxes(self, slide, boundary, n=10):
+    def _add_link_overlay(self, slide, left, top, html_graph_filename):
+        """Adds a transparent shape over a chart to serve as the clickable link."""
+        hyperlink_shape = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, left, top, self.img_width, self.img_height
+        )
+
+        blueBoxFill = hyperlink_shape.fill
+        blueBoxFill.solid()
+        blueBoxFillColour = blueBoxFill.fore_color
+        blueBoxFillColour.rgb = RGBColor(255, 255, 255)
+        self._set_shape_transparency(hyperlink_shape, 1000)
+        hyperlink_shape.line.color.rgb = RGBColor(255, 255, 255)
+
+        # Create a hyperlink to the html graph file
+        hyperlink_shape.click_action.hyperlink.address = html_graph_filename
+
+    def _add_native_charts(self, slide, player_df, html_graph_filename):
+        """Adds the bar and scatter charts as PowerPoint charts where the PNGs would go."""
+        dates = player_df["date"].tolist()
+        scores = player_df["Score"].tolist()
+        left = Inches(0.25)
+        top = Inches(1)
+        width, height = int(self.img_width), int(self.img_height)
+
+        add_bar_chart(slide, left, top, width, height, dates, scores, self.chart_style)
+        self._add_link_overlay(slide, left, top, html_graph_filename)
+
+        # Position next chart below the first
+        top += height
+        add_scatter_chart(slide, left, top, width, height, scores, self.chart_style)
+        self._add_link_overlay(slide, left, top, html_graph_filename)
+
+    def _stamp_images(self, slide, img_paths, html_graph_filename):
+        """Adds the chart images and their link overlays, stamped from a template."""
+        elements = self._stamp_shapes(
+            slide,
+            "chart_images",
+            lambda s: self._add_images(s, img_paths, html_graph_filename),
+            bind_rels=False,
+        )
+        img_paths = iter(img_paths)
+        for element in elements:
+            if element.tag == qn("p:pic"):
+                image_part, rId = slide.part.get_or_add_image_part(next(img_paths))
+                element.blipFill.blip.rEmbed = rId
+                element.nvPicPr.cNvPr.set("descr", image_part.desc)
+                continue
+
+            # Link overlay of the picture before it
+            cNvPr = element.nvSpPr.cNvPr
+            cNvPr._remove_hlinkClick()
+            if html_graph_filename:
+                cNvPr.get_or_add_hlinkClick().rId = slide.part.relate_to(
+                    html_graph_filename, RT.HYPERLINK, is_external=True
+                )
+
+    def _random_boxes(self, boundary, n=10, rng=random):
         """
-        Adds n random boxes within the specified boundary to the slide.
-        Each box has a random shape, rotation, and fill color.
+        Returns n random boxes within the specified boundary.
+        Each box is a (left, top, width, rotation, color) square.
 
         Parameters:
-        - slide: The slide to which the boxes will be added.
         - boundary: A tuple (x_min, y_min, x_max, y_max) specifying the boundary.
-        - n: The number of random boxes to add. Default is 10.
+        - n: The number of random boxes. Default is 10.
+        - rng: The random number generator to draw from.
         """
         x_min, y_min, x_max, y_max = boundary
 
+        boxes = []
         for _ in range(n):
             # Randomly select a position within the boundary
-            left = random.uniform(x_min, x_max)
-            top = random.uniform(y_min, y_max)
+            left = rng.uniform(x_min, x_max)
+            top = rng.uniform(y_min, y_max)
 
             # Randomly select a width and height
             # width = Inches(2)  # Inches
-            width = Inches(random.uniform(0.5, 2))  # Inches
+            width = Inches(rng.uniform(0.5, 2))  # Inches
 
             # Ensure the box stays within the boundary
             left = min(left, x_max - width)
             top = min(top, y_max - width)
 
-            text_box = slide.shapes.add_textbox(left, top, width, width)
+            # Random rotation between 0 and 360 degrees
+            rotation_angle = rng.uniform(0, 360)
+            randomBlue = rng.randint(200, 255)
+            randomRed = rng.randint(100, 115)
+            boxes.append(
+                (left, top, width, rotation_angle, RGBColor(randomRed, 204, randomBlue))
+            )
+        return boxes
+
+    def _add_decoration(self, slide, boundary, n=10):
+        """Adds the decorative boxes within `boundary` in the deck's decoration mode.
+
+        "boxes" adds n random text boxes to every slide. "band" draws n boxes,
+        seeded, into one image per deck, and every slide shows that image."""
+        if self.decoration == "boxes":
+            self._add_random_boxes(slide, boundary, n)
+            return
+
+        band = self._bands.get((boundary, n))
+        if band is None:
+            boxes = self._random_boxes(boundary, n, random.Random(self.decoration_seed))
+            if not boxes:
+                return
+            band = render_band(boxes, self.prs.slide_width, self.prs.slide_height)
+            self._bands[(boundary, n)] = band
 
-            # Randomly rotate the textbox
-            rotation_angle = random.uniform(
-                0, 360
-            )  # Random rotation between 0 and 360 degrees
-            text_box.rotation = rotation_angle
+        # Same image bytes, so every slide links to the one image part
+        image, left, top, width, height = band
+        slide.shapes.add_picture(BytesIO(image), left, top, width, height)
 
-            fill = text_box.fill
-            fill.solid()
-            randomBlue = random.randint(200, 255)
-            randomRed = random.randint(100, 115)
-            fill.fore_color.rgb = RGBColor(randomRed, 204, randomBlue)
+    def _add_random_boxes(self, slide, boundary, n=10):
+        """
+        Adds n random boxes within the specified boundary to the slide.
+        Each box has a random shape, rotation, and fill color.
 
-            transparency = random.randint(0, 100)
-            fill.transparency = transparency
+        Parameters:
+        - slide: The slide to which the boxes will be added.
+        - boundary: A tuple (x_min, y_min, x_max, y_max) specifying the boundary.
+        - n: The number of random boxes to add. Default is 10.
+        """
+        boxes = self._random_boxes(boundary, n)
+        if not boxes:
+            return
+
+        # Every box is a copy of one prototype box, moved, rotated and recoloured
+        elements = self._stamp_shapes(
+            slide, "random_box", lambda s: self._add_box(s, *boxes[0]), copies=n
+        )
+        for box, (left, top, width, rotation_angle, color) in zip(elements, boxes):
+            xfrm = box.spPr.xfrm
+            xfrm.set("rot", ST_Angle.convert_to_xml(rotation_angle))
+            xfrm.off.set("x", str(int(left)))
+            xfrm.off.set("y", str(int(top)))
+            xfrm.ext.set("cx", str(width))
+            xfrm.ext.set("cy", str(width))
+            box.spPr.solidFill.srgbClr.set("val", str(color))
+
+    def _add_box(self, slide, left, top, width, rotation_angle, color):
+        """Adds one square, rotated and filled box."""
+        text_box = slide.shapes.add_textbox(left, top, width, width)
+        text_box.rotation = rotation_angle
+
+        fill = text_box.fill
+        fill.solid()
+        fill.fore_color.rgb = color
 
     def _add_top_drivers(self, driver_data, key):
         # Step 1: Group driver_data into groups of four
@@ -644,7 +908,7 @@ class CustomPresentation:
             text_frame1.paragraphs[0].font.size = Pt(18)
 
             boundary = (Inches(-2), Inches(8), Inches(15), Inches(9))
-            self._add_random_boxes(slide, boundary, 100)
+            self._add_decoration(slide, boundary, 100)
 
             # Positioning variables for tables
             top = Inches(2)
@@ -675,12 +939,17 @@ class CustomPresentation:
         extra_header=None,
         merge_indices=None,
     ):
+        # An updated deck gets a fresh aggregate slide
+        for old_slide in self.find_slides("aggregate"):
+            self.remove_slide(old_slide)
+
         slide = self._get_new_slide()
+        self._tag_slide(slide, "aggregate")
 
         # Add random Boxes at the bottom
         # x_min, y_min, x_max, y_max
         boundary = (Inches(-2), Inches(8), Inches(15), Inches(9))
-        self._add_random_boxes(slide, boundary, 100)
+        self._add_decoration(slide, boundary, 100)
 
         # Text Frames
         left = Inches(0.5)
@@ -696,55 +965,24 @@ class CustomPresentation:
         left = table_left
 
         rows, cols = table_data.shape
+        merged_header = None
         if extra_header and merge_indices:
-            shape = slide.shapes.add_table(
-                rows + 2, cols, left, top, table_width, Inches(0.2 * (rows + 2))
-            )
-        else:
-            shape = slide.shapes.add_table(
-                rows + 1, cols, left, top, table_width, Inches(0.2 * (rows + 1))
-            )
+            merged_header = list(zip(merge_indices, extra_header))
+            rows += 1
 
-        tbl = shape._element.graphic.graphicData.tbl
-        style_id = "{69012ECD-51FC-41F1-AA8D-1B2483CD663E}"
-        tbl[0][-1].text = style_id
-
-        table = shape.table
-
-        row_additive = 0
-
-        if extra_header and merge_indices:
-            row_additive = 1
-            for indexes, text in zip(merge_indices, extra_header):
-                print(indexes)
-                print(text)
-                (start_col, end_col) = indexes
-                # Merge cells in the specified range
-                cell_start = table.cell(0, start_col)
-                cell_end = table.cell(0, end_col - 1)
-                cell_start.merge(cell_end)
-                # Set the text for the merged cell
-                cell_start.text = text
-                cell_start.text_frame.paragraphs[0].font.size = Pt(16)
-                cell_start.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-
-        for col_idx, column_name in enumerate(table_data.columns):
-            cell = table.cell(row_additive, col_idx)
-            cell.text = column_name
-            cell.text_frame.paragraphs[0].font.size = Pt(16)
-
-            if col_idx > 0:
-                cell.text_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
-
-        for row_idx, (index, row) in enumerate(table_data.iterrows(), start=1):
-            for col_idx, value in enumerate(row):
-                cell = table.cell(row_idx + row_additive, col_idx)
-                cell.text = str(value)
-                cell.text_frame.paragraphs[0].font.size = Pt(14)
-
-                # Align all columns except the first one to the right
-                if col_idx > 0:
-                    cell.text_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
+        # .values holds the same values and dtypes iterrows() would yield
+        values = table_data.values
+        self._add_table(
+            slide,
+            left,
+            top,
+            table_width,
+            Inches(0.2 * (rows + 1)),
+            list(table_data.columns),
+            [values[:, col_idx] for col_idx in range(cols)],
+            AGGREGATE_TABLE_STYLE,
+            merged_header,
+        )
 
         # Logo
         self._add_slide_logo(slide, self.logo)
@@ -755,7 +993,24 @@ class CustomPresentation:
         xml_slides.remove(slides[-1])  # Remove the last slide (the one just added)
         xml_slides.insert(1, slides[-1])  # Insert it as the 2nd slide (index 1)
 
+    def flush(self):
+        """Writes the slides finished since the last flush when streaming.
+
+        The slide order lives in the presentation part, which is written by
+        save(), so flushed slides can still be reordered."""
+        if self.writer is None:
+            return
+        for slide in self._pending_slides:
+            self.writer.write_slide(slide)
+        self._pending_slides = []
+
     def save(self, filename):
         """Saves the presentation."""
-        self.add_end_slide()
+        if not self.find_slides("end"):
+            self.add_end_slide()
+        self._renumber_slides()
+        if self.writer is not None:
+            self.writer.close(self.prs.part.package, filename)
+            self.writer = None
+            return
         self.prs.save(filename)
@@ -0,0 +1,114 @@
+import calendar
+
+import numpy as np
+import pandas as pd
+
+# Full and abbreviated month names, e.g. "september", "sep" and "sept" -> 9
+MONTHS = {}
+for number in range(1, 13):
+    MONTHS[calendar.month_name[number].lower()] = number
+    MONTHS[calendar.month_abbr[number].lower()] = number
+MONTHS["sept"] = 9
+
+# (name, pattern) of every date layout found in the scraped Date column, tried
+# in order; a missing day or month is taken as the first
+DATE_FORMATS = [
+    # 29 December 1928, 27 Aug 1908
+    (
+        "day month year",
+        r"^(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+(?P<month>[A-Za-z]+)\.?,?\s+(?P<year>\d{4})$",
+    ),
+    # June 26, 1999
+    (
+        "month day, year",
+        r"^(?P<month>[A-Za-z]+)\.?\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<year>\d{4})$",
+    ),
+    # July 1999
+    ("month year", r"^(?P<month>[A-Za-z]+)\.?,?\s+(?P<year>\d{4})$"),
+    # 2010-09-07, also with a time
+    ("iso", r"^(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})(?:[ T][\d:.]+)?$"),
+    # 2011
+    ("year", r"^(?P<year>\d{4})(?:\.0)?$"),
+]
+
+
+class DateNormalizer:
+    """Parses the mixed-format Date column once, when the data is loaded.
+
+    Each distinct string is parsed once: the unique values are matched against
+    DATE_FORMATS with vectorized regular expressions and assembled into dates in
+    one pass, then mapped back onto every row. normalize() adds a nullable
+    integer `year` column and a datetime `parsed_date` column; the rows no
+    format matched keep missing values there and are listed in `unparsed`.
+    """
+
+    def __init__(self, column="Date"):
+        self.column = column
+        self.format_counts = {}
+        self.unparsed = None
+
+    def _parse_unique(self, values):
+        """Returns the (year, month, day) arrays of `values`, 0 where unparsed."""
+        text = pd.Series(values, dtype=object).map(
+            lambda value: value if isinstance(value, str) else str(value)
+        )
+        text = text.str.strip()
+        parts = np.zeros((3, len(text)), dtype=np.int64)
+        pending = np.ones(len(text), dtype=bool)
+
+        for name, pattern in DATE_FORMATS:
+            if not pending.any():
+                break
+            candidates = text[pending]
+            found = candidates.str.extract(pattern)
+            found = found[found["year"].notna()]
+            if "month" in found:
+                months = found["month"].str.lower().map(MONTHS)
+                months = months.fillna(
+                    pd.to_numeric(found["month"], errors="coerce")
+                )
+                found = found.assign(month=months)[months.between(1, 12)]
+            if found.empty:
+                continue
+
+            rows = found.index.to_numpy()
+            parts[0, rows] = found["year"].astype(np.int64)
+            parts[1, rows] = found["month"].astype(np.int64) if "month" in found else 1
+            parts[2, rows] = found["day"].astype(np.int64) if "day" in found else 1
+            pending[rows] = False
+            self.format_counts[name] = self.format_counts.get(name, 0) + len(rows)
+
+        return parts
+
+    def normalize(self, frame):
+        """Returns `frame` with `year` and `parsed_date` columns parsed from the dates."""
+        self.format_counts = {}
+        codes, uniques = pd.factorize(frame[self.column])
+        year, month, day = self._parse_unique(uniques)
+
+        dates = pd.to_datetime(
+            pd.DataFrame({"year": year, "month": month, "day": day}),
+            errors="coerce",
+        )
+        # Codes of -1 (empty cells) point past the uniques, at a missing value
+        dates = np.append(dates.to_numpy(), np.datetime64("NaT"))[codes]
+
+        frame = frame.copy()
+        frame["parsed_date"] = dates
+        frame["year"] = frame["parsed_date"].dt.year.astype("Int64")
+        self.unparsed = frame.loc[frame["parsed_date"].isna(), [self.column]]
+        return frame
+
+    def report(self, limit=5):
+        """Returns a one-paragraph summary of the formats found and the rows left unparsed."""
+        formats = ", ".join(
+            f"{count} {name}" for name, count in self.format_counts.items()
+        )
+        lines = [f"Dates parsed per format (distinct values): {formats or 'none'}"]
+        if self.unparsed is not None and len(self.unparsed):
+            examples = self.unparsed[self.column].astype(str).unique()[:limit]
+            lines.append(
+                f"{len(self.unparsed)} rows have no parseable {self.column}, e.g. "
+                + ", ".join(repr(example) for example in examples)
+            )
+        return "\n".join(lines)
@@ -0,0 +1,161 @@
+import copy
+import json
+import re
+
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+from pptx.parts.image import ImagePart
+
+# The r:embed / r:link / r:id attributes that point at relationships
+REL_ATTRIBUTES = etree.XPath(
+    ".//@*[namespace-uri() = '%s']" % qn("r:id").rpartition("}")[0][1:]
+)
+
+# Slides every generated deck starts or ends with; the merged deck keeps one of each
+SHARED_SLIDE_KINDS = ("intro", "end")
+
+
+class DeckMerger:
+    """Concatenates the slides of generated decks into one presentation.
+
+    Slide parts are copied as XML and images as bytes, without going through the
+    shape API, so merging takes seconds whatever the decks hold. Images are
+    deduplicated by hash (the logo, flags and band are stored once), slide
+    layouts are matched by name, and the intro and end slides are kept once,
+    at the start and end of the merged deck.
+    """
+
+    def __init__(self, base_path):
+        """Starts the merged deck from the deck at `base_path`."""
+        self.prs = Presentation(base_path)
+        self.package = self.prs.part.package
+
+        self._partnames = set()
+        self._media = {}
+        for part in self.package.iter_parts():
+            self._partnames.add(part.partname)
+            if isinstance(part, ImagePart):
+                self._media[part.sha1] = part
+        self._next_index = {}
+
+        sldIdLst = self.prs.slides._sldIdLst
+        self._next_slide_id = max([255] + [sldId.id for sldId in sldIdLst]) + 1
+
+        # The end slide is moved after the slides of every merged deck
+        self._end_slides = [
+            sldId
+            for slide, sldId in zip(self.prs.slides, list(sldIdLst))
+            if self._slide_kind(slide.part) == "end"
+        ]
+        for sldId in self._end_slides:
+            sldIdLst.remove(sldId)
+
+    def _slide_kind(self, slide_part):
+        """Returns the kind stored in a slide's name by CustomPresentation._tag_slide."""
+        try:
+            tag = json.loads(slide_part._element.cSld.name)
+        except ValueError:
+            return None
+        return tag.get("kind") if isinstance(tag, dict) else None
+
+    def _next_partname(self, partname):
+        """Returns an unused partname numbered like `partname`, e.g. slide7.xml."""
+        match = re.match(r"(.*?)(\d*)(\.\w+)$", partname)
+        tmpl = match.group(1) + "%d" + match.group(3)
+        idx = self._next_index.get(tmpl, 1)
+        while PackURI(tmpl % idx) in self._partnames:
+            idx += 1
+        self._next_index[tmpl] = idx + 1
+        self._partnames.add(PackURI(tmpl % idx))
+        return PackURI(tmpl % idx)
+
+    def _layout_part(self, source_layout, layouts):
+        """Returns the layout of the merged deck with the name of `source_layout`."""
+        name = source_layout._element.cSld.name
+        layout = layouts.get_by_name(name) or layouts[0]
+        return layout.part
+
+    def _copy_image(self, part):
+        existing = self._media.get(part.sha1)
+        if existing is None:
+            existing = ImagePart(
+                self._next_partname(part.partname),
+                part.content_type,
+                self.package,
+                part.blob,
+                part._filename,
+            )
+            self._media[part.sha1] = existing
+        return existing
+
+    def _copy_part(self, part, layouts, copied):
+        """Copies `part` and everything it relates to into the merged package.
+
+        `copied` maps the parts of the source deck copied so far to their copies."""
+        if part in copied:
+            return copied[part]
+        if isinstance(part, ImagePart):
+            copied[part] = self._copy_image(part)
+            return copied[part]
+        if part.partname.startswith("/ppt/slideLayouts/"):
+            copied[part] = self._layout_part(part, layouts)
+            return copied[part]
+
+        partname = self._next_partname(part.partname)
+        element = getattr(part, "_element", None)
+        if element is not None:
+            new_part = type(part)(
+                partname, part.content_type, self.package, copy.deepcopy(element)
+            )
+        else:
+            new_part = Part(partname, part.content_type, self.package, part.blob)
+        copied[part] = new_part
+
+        rIds = {}
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                rIds[rId] = new_part.relate_to(rel.target_ref, rel.reltype, True)
+            elif rel.reltype != RT.NOTES_SLIDE:
+                target = self._copy_part(rel.target_part, layouts, copied)
+                rIds[rId] = new_part.relate_to(target, rel.reltype)
+
+        if element is not None:
+            for value in REL_ATTRIBUTES(new_part._element):
+                if value in rIds:
+                    value.getparent().set(value.attrname, rIds[value])
+        return new_part
+
+    def append(self, path):
+        """Appends the slides of the deck at `path`, skipping its intro and end slides."""
+        source = Presentation(path)
+        copied = {}
+        for slide in source.slides:
+            if self._slide_kind(slide.part) in SHARED_SLIDE_KINDS:
+                continue
+            slide_part = self._copy_part(slide.part, self.prs.slide_layouts, copied)
+            # A new part cannot already be related, so skip relate_to's lookup of
+            # the existing relationships and add_sldId's scan of the slide ids
+            rId = self.prs.part.rels._add_relationship(RT.SLIDE, slide_part)
+            self.prs.slides._sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+            self._next_slide_id += 1
+
+    def save(self, filename):
+        """Saves the merged deck, with the base deck's end slide last."""
+        sldIdLst = self.prs.slides._sldIdLst
+        for sldId in self._end_slides:
+            sldIdLst.append(sldId)
+        self._end_slides = []
+        self.prs.part.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+        self.prs.save(filename)
+
+
+def merge_decks(paths, filename):
+    """Merges the decks at `paths`, in order, into one deck saved at `filename`."""
+    merger = DeckMerger(paths[0])
+    for path in paths[1:]:
+        merger.append(path)
+    merger.save(filename)
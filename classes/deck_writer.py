@@ -0,0 +1,110 @@
+import shutil
+import tempfile
+
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem, _PhysPkgWriter
+from pptx.parts.image import ImagePart
+from pptx.parts.slide import (
+    NotesMasterPart,
+    SlideLayoutPart,
+    SlideMasterPart,
+    SlidePart,
+)
+
+# Parts a slide refers to that other slides use too; they are written on close
+SHARED_PARTS = (SlideLayoutPart, SlideMasterPart, NotesMasterPart, SlidePart)
+
+
+class _WrittenImagePart(ImagePart):
+    """An image part whose bytes are already in the output zip.
+
+    It keeps the hash and size python-pptx needs to reuse it for a repeated
+    picture (the logo, the decoration band) without holding the image itself."""
+
+    @property
+    def _native_size(self):
+        return self._written_size
+
+
+class StreamingDeckWriter:
+    """Writes a deck into its zip slide by slide instead of all at once on save.
+
+    `write_slide` stores a finished slide and the parts only it uses (images,
+    native charts and their embedded workbooks), then empties the slide's shape
+    tree and releases those parts' content, so memory no longer grows with the
+    number of slides. `close` writes everything still in memory: the
+    presentation part (with the final slide order), masters, layouts, theme,
+    package relationships and content types.
+
+    Slides must not be edited or removed once written."""
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._writer = _PhysPkgWriter.factory(self._file)
+        self._written = set()
+
+    def _write_part(self, part):
+        if part.partname in self._written:
+            return False
+        self._writer.write(part.partname, part.blob)
+        if part._rels:
+            self._writer.write(part.partname.rels_uri, part.rels.xml)
+        self._written.add(part.partname)
+        return True
+
+    def _release_image(self, part):
+        # Cache what python-pptx reads from the blob before dropping it
+        part._written_size = part._native_size
+        part.sha1
+        part._blob = b""
+        part.__class__ = _WrittenImagePart
+
+    def _release(self, part):
+        if isinstance(part, ImagePart):
+            self._release_image(part)
+        elif isinstance(part, XmlPart):
+            part._element = None
+        else:
+            part._blob = b""
+
+    def _write_related(self, part):
+        """Writes and frees the not yet written, unshared parts `part` refers to."""
+        for rel in part.rels.values():
+            if rel.is_external or isinstance(rel.target_part, SHARED_PARTS):
+                continue
+            target = rel.target_part
+            if target.partname in self._written:
+                continue
+            # A chart's embedded workbook goes before the chart that holds it
+            self._write_related(target)
+            self._write_part(target)
+            self._release(target)
+
+    def write_slide(self, slide):
+        """Writes a slide and the parts only it uses, then frees them."""
+        part = slide.part
+        self._write_related(part)
+        self._write_part(part)
+
+        # Keep the group properties and the slide name, which holds its tag
+        spTree = slide.shapes._spTree
+        for shape in list(spTree)[2:]:
+            spTree.remove(shape)
+
+    def close(self, package, filename):
+        """Writes the remaining parts of `package` and moves the zip to `filename`."""
+        parts = tuple(package.iter_parts())
+        for part in parts:
+            self._write_part(part)
+        self._writer.write(PACKAGE_URI.rels_uri, package._rels.xml)
+        self._writer.write(
+            CONTENT_TYPES_URI, serialize_part_xml(_ContentTypesItem.xml_for(parts))
+        )
+        self._writer._zipf.close()
+
+        self._file.seek(0)
+        with open(filename, "wb") as f:
+            shutil.copyfileobj(self._file, f)
+        self._file.close()
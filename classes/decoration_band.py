@@ -0,0 +1,64 @@
+import math
+from io import BytesIO
+
+from PIL import Image, ImageDraw
+
+EMU_PER_INCH = 914400
+
+
+def render_band(boxes, slide_width, slide_height, dpi=150, supersample=2):
+    """Renders the decorative boxes of a slide into one transparent PNG.
+
+    Parameters:
+    - boxes: (left, top, width, rotation, color) of each square, in EMU and degrees
+      (clockwise, about the centre, as PowerPoint rotates shapes). Later boxes are
+      drawn over earlier ones, like the shapes they replace.
+    - slide_width, slide_height: Parts of the boxes outside the slide are cut off.
+    - dpi: Resolution of the image at its size on the slide.
+    - supersample: Draws at this multiple of `dpi` and scales down to smooth edges.
+
+    Returns (png_bytes, left, top, width, height), with the position in EMU.
+    """
+    polygons = []
+    for left, top, width, rotation, color in boxes:
+        half = width / 2
+        cx, cy = left + half, top + half
+        cos = math.cos(math.radians(rotation))
+        sin = math.sin(math.radians(rotation))
+        corners = [(-half, -half), (half, -half), (half, half), (-half, half)]
+        points = [(cx + dx * cos - dy * sin, cy + dx * sin + dy * cos) for dx, dy in corners]
+        polygons.append((points, tuple(color)))
+
+    xs = [x for points, _ in polygons for x, _ in points]
+    ys = [y for points, _ in polygons for _, y in points]
+    left = max(0, math.floor(min(xs)))
+    top = max(0, math.floor(min(ys)))
+    width = min(slide_width, math.ceil(max(xs))) - left
+    height = min(slide_height, math.ceil(max(ys))) - top
+
+    scale = dpi * supersample / EMU_PER_INCH
+    image = Image.new(
+        "RGBA",
+        (max(1, round(width * scale)), max(1, round(height * scale))),
+        (0, 0, 0, 0),
+    )
+    draw = ImageDraw.Draw(image)
+    for points, color in polygons:
+        draw.polygon(
+            [((x - left) * scale, (y - top) * scale) for x, y in points],
+            fill=color + (255,),
+        )
+
+    # Premultiplied alpha keeps the transparent background from darkening the edges
+    image = (
+        image.convert("RGBa")
+        .resize(
+            (max(1, round(width * scale / supersample)), max(1, round(height * scale / supersample))),
+            Image.LANCZOS,
+        )
+        .convert("RGBA")
+    )
+
+    buffer = BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue(), left, top, width, height
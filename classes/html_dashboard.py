@@ -0,0 +1,168 @@
+import json
+
+# One page per deck: plotly.js is inlined once, every player's series sits in a
+# JSON block, and the two figures are only built when a player is opened
+# (index.html#<player>), so the page works offline and opens fast.
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+    body {{ margin: 0; font-family: sans-serif; }}
+    header, footer {{
+        background-color: #333;
+        color: white;
+        text-align: center;
+        padding: 10px;
+        z-index: 1000;
+    }}
+    header {{ position: sticky; top: 0; font-size: 18px; font-weight: bold; }}
+    footer {{ position: fixed; bottom: 0; width: 100%; font-size: 14px; }}
+    main {{ display: flex; }}
+    nav {{ min-width: 200px; padding: 10px; border-right: 1px solid #ddd; }}
+    nav a {{ display: block; padding: 4px 0; color: #0066a1; text-decoration: none; }}
+    nav a.active {{ font-weight: bold; }}
+    #charts {{ flex: 1; padding-bottom: 60px; }}
+</style>
+<script>{plotly_js}</script>
+</head>
+<body>
+<header id="title">{title}</header>
+<main>
+    <nav id="players"></nav>
+    <div id="charts">
+        <div id="bar"></div>
+        <br><br>
+        <div id="scatter"></div>
+    </div>
+</main>
+<footer>Generated on: {generated_on}  | Ayush Dhanraj</footer>
+<script type="application/json" id="player-data">{players_json}</script>
+<script type="application/json" id="chart-style">{style_json}</script>
+<script>
+const PLAYERS = JSON.parse(document.getElementById("player-data").textContent);
+const STYLE = JSON.parse(document.getElementById("chart-style").textContent);
+const HOVER = "<b>%{{customdata}}</b><br>Score: %{{y}}<extra></extra>";
+
+function linspace(start, stop, num) {{
+    const step = (stop - start) / (num - 1);
+    return Array.from({{length: num}}, (_, i) => start + step * i);
+}}
+
+function showPlayer(name) {{
+    const player = PLAYERS[name];
+    if (!player) {{
+        return;
+    }}
+    const x = player.scores.map((_, i) => i);
+
+    document.getElementById("title").textContent =
+        STYLE.key + " - " + name + " - " + STYLE.generated_on;
+    for (const link of document.querySelectorAll("#players a")) {{
+        link.classList.toggle("active", link.dataset.player === name);
+    }}
+
+    Plotly.react("bar", [{{
+        type: "bar",
+        x: x,
+        y: player.scores,
+        text: player.scores.map(String),
+        textposition: "outside",
+        name: "Scores",
+        marker: {{color: STYLE.bar_color}},
+        hovertemplate: HOVER,
+        customdata: player.dates,
+    }}], {{
+        title: {{text: STYLE.bar_title}},
+        annotations: x.map((xi, i) => ({{
+            x: xi,
+            y: player.scores[i] * 0.1,
+            text: player.dates[i],
+            showarrow: false,
+            font: {{size: 12, color: "white"}},
+            textangle: 90,
+            xanchor: "center",
+            yanchor: "bottom",
+        }})),
+        xaxis: {{title: {{text: ""}}, showticklabels: false}},
+        yaxis: {{title: {{text: "Runs Scored"}}, tickmode: "linear", dtick: 1}},
+        bargap: 0.2,
+        margin: {{t: 60, b: 30}},
+        height: STYLE.html_height,
+    }});
+
+    const traces = [{{
+        type: "scatter",
+        x: x,
+        y: player.scores,
+        mode: "markers",
+        marker: {{size: 10, color: STYLE.scatter_color, line: {{width: 1, color: "black"}}}},
+        name: "Scores",
+        hovertemplate: HOVER,
+        customdata: player.dates,
+    }}];
+    if (player.trend) {{
+        traces.push({{
+            type: "scatter",
+            x: linspace(0, x.length - 1, player.trend.length),
+            y: player.trend,
+            mode: "lines",
+            name: "Trend Line",
+            line: {{color: STYLE.trend_color, dash: "dash"}},
+        }});
+    }}
+    Plotly.react("scatter", traces, {{
+        title: {{text: STYLE.scatter_title}},
+        xaxis: {{title: {{text: ""}}, showticklabels: false}},
+        yaxis: {{title: {{text: "Total Centuries"}}, tickmode: "linear", dtick: 1}},
+        height: STYLE.html_height,
+        margin: {{t: 60, b: 30}},
+        legend: {{orientation: "h", yanchor: "bottom", y: 1.02, xanchor: "right", x: 1}},
+    }});
+}}
+
+const nav = document.getElementById("players");
+for (const name of Object.keys(PLAYERS)) {{
+    const link = document.createElement("a");
+    link.href = "#" + encodeURIComponent(name);
+    link.textContent = name;
+    link.dataset.player = name;
+    nav.appendChild(link);
+}}
+
+function showFromHash() {{
+    const name = decodeURIComponent(location.hash.slice(1));
+    showPlayer(name in PLAYERS ? name : Object.keys(PLAYERS)[0]);
+}}
+window.addEventListener("hashchange", showFromHash);
+showFromHash();
+</script>
+</body>
+</html>
+"""
+
+
+def _script_json(value):
+    """Serializes `value` for embedding inside a <script> element."""
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
+
+
+def build_dashboard_html(key, players, chart_style, generated_on, plotly_js):
+    """Returns the dashboard page of one deck.
+
+    Parameters:
+    - key: The deck key shown in the header.
+    - players: Ordered mapping of player name to {"dates", "scores", "trend"}.
+    - chart_style: Titles, colours and height shared with the PNG charts.
+    - generated_on: Date shown in the header and footer.
+    - plotly_js: The plotly.js bundle to inline.
+    """
+    style = {**chart_style, "key": key, "generated_on": str(generated_on)}
+    return DASHBOARD_TEMPLATE.format(
+        title=f"{key} - Player Centuries Scored Analysis",
+        plotly_js=plotly_js,
+        generated_on=generated_on,
+        players_json=_script_json(players),
+        style_json=_script_json(style),
+    )
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class ImageCache:
+    """Persistent, content-addressed on-disk cache of downloaded images.
+
+    Entries are keyed by URL and point at a blob named after the SHA-256 of its
+    bytes, so URLs serving the same picture (e.g. a shared country flag) are
+    stored once. Each entry keeps the ETag/Last-Modified validators of the
+    response for conditional revalidation, and the least recently used entries
+    are evicted once the blobs exceed `max_bytes`.
+
+    Parameters:
+    - cache_dir: Directory holding `index.json` and the `objects/` blobs.
+    - max_bytes: Size cap for the stored blobs.
+    - max_age: Seconds an entry is served without revalidation.
+    - offline: Never touch the network; serve only what is cached.
+    """
+
+    def __init__(
+        self,
+        cache_dir=".image_cache",
+        max_bytes=256 * 1024 * 1024,
+        max_age=7 * 24 * 3600,
+        offline=False,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.offline = offline
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, "objects", digest[:2], digest)
+
+    def _entry(self, url):
+        """Returns the index entry of `url` if its blob is still on disk."""
+        entry = self._index.get(url)
+        if entry is None or not os.path.exists(self._blob_path(entry["sha256"])):
+            return None
+        return entry
+
+    def is_fresh(self, url):
+        """True if `url` is cached and younger than `max_age`."""
+        with self._lock:
+            entry = self._entry(url)
+            return entry is not None and time.time() - entry["fetched"] < self.max_age
+
+    def read(self, url):
+        """Returns the cached bytes of `url`, or None if it is not cached."""
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                return None
+            entry["last_used"] = time.time()
+            digest = entry["sha256"]
+
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                return f.read()
+        except OSError:
+            # Evicted by a concurrent store() since the lookup: treat it as a miss
+            with self._lock:
+                if self._index.get(url, {}).get("sha256") == digest:
+                    del self._index[url]
+            return None
+
+    def validators(self, url):
+        """Returns the conditional request headers for revalidating `url`."""
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                return {}
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def revalidated(self, url):
+        """Marks a cached entry as fresh again after a 304 Not Modified."""
+        with self._lock:
+            entry = self._entry(url)
+            if entry is not None:
+                entry["fetched"] = entry["last_used"] = time.time()
+
+    def store(self, url, content, headers=None):
+        """Stores the downloaded bytes of `url` with the response validators."""
+        headers = headers or {}
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        with self._lock:
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                tmp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, blob_path)
+
+            now = time.time()
+            self._index[url] = {
+                "sha256": digest,
+                "size": len(content),
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched": now,
+                "last_used": now,
+            }
+            self._evict()
+
+    def _evict(self):
+        """Drops least recently used entries until the blobs fit in `max_bytes`."""
+        blob_sizes = {}
+        last_used = {}
+        for entry in self._index.values():
+            digest = entry["sha256"]
+            blob_sizes[digest] = entry["size"]
+            last_used[digest] = max(last_used.get(digest, 0), entry["last_used"])
+
+        total = sum(blob_sizes.values())
+        for digest in sorted(last_used, key=last_used.get):
+            if total <= self.max_bytes:
+                break
+            self._index = {
+                url: entry
+                for url, entry in self._index.items()
+                if entry["sha256"] != digest
+            }
+            try:
+                os.remove(self._blob_path(digest))
+            except OSError:
+                pass
+            total -= blob_sizes[digest]
+
+    def save(self):
+        """Writes the index to disk."""
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self.index_path)
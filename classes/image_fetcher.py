@@ -0,0 +1,142 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from tracing import NULL_TRACER
+
+
+class ImageFetcher:
+    """Downloads player photos and flags over one pooled HTTP session.
+
+    `prefetch` pulls every distinct URL concurrently before the slides are built,
+    so the slide code only reads bytes from memory. With an ImageCache, fresh
+    entries are served from disk, stale ones are revalidated with a conditional
+    GET, and in offline mode the network is never touched (requests is not even
+    imported: the session is only built for the first real download).
+
+    The downloaded bytes are kept in `contents` by URL. Subclasses fetching
+    other files set `span_name`, the name of their download spans."""
+
+    span_name = "image_download"
+
+    def __init__(
+        self,
+        max_workers=8,
+        timeout=10,
+        retries=3,
+        backoff_factor=0.5,
+        cache=None,
+        tracer=None,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+        self.tracer = tracer or NULL_TRACER
+        self.contents = {}
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The pooled HTTP session, built on first use."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=self.retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET",),
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=self.max_workers,
+                    pool_maxsize=self.max_workers,
+                    max_retries=retry,
+                )
+                self._session = requests.Session()
+                self._session.mount("http://", adapter)
+                self._session.mount("https://", adapter)
+            return self._session
+
+    def _download(self, url):
+        """Returns the bytes at `url`, or None if the download failed."""
+        with self.tracer.span(self.span_name, url=url) as span:
+            content = self._fetch(url, span)
+            span.set(bytes=len(content) if content else 0)
+            return content
+
+    def _fetch(self, url, span):
+        cache = self.cache
+        if cache is not None and (cache.offline or cache.is_fresh(url)):
+            content = cache.read(url)
+            # Online, an entry evicted since is_fresh() is downloaded again
+            if content is not None or cache.offline:
+                span.set(cache="hit")
+                if content is None:
+                    print(f"Not in offline cache: {url}")
+                return content
+
+        headers = cache.validators(url) if cache is not None else {}
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and cache is not None:
+                cache.revalidated(url)
+                content = cache.read(url)
+                if content is not None:
+                    span.set(cache="revalidated")
+                    return content
+                # Evicted since validators(): the 304 has nothing to confirm
+                response = self.session.get(url, timeout=self.timeout)
+            if response.status_code == 200:
+                span.set(cache="miss")
+                if cache is not None:
+                    cache.store(url, response.content, response.headers)
+                return response.content
+            print(f"Failed to download {url}")
+        except Exception as e:
+            print(f"Error downloading {url}: {e}")
+
+        # Fall back to a stale copy rather than leaving the slide without a picture
+        span.set(cache="stale")
+        return cache.read(url) if cache is not None else None
+
+    def prefetch(self, urls):
+        """Downloads every distinct, not yet fetched URL concurrently."""
+        pending = [
+            url
+            for url in dict.fromkeys(urls)
+            if isinstance(url, str) and url and url not in self.contents
+        ]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for url, content in zip(pending, executor.map(self._download, pending)):
+                self.contents[url] = content
+
+        if self.cache is not None:
+            self.cache.save()
+
+    def get(self, url):
+        """Returns the bytes at `url`, downloading them if they were not prefetched.
+
+        Failed downloads are remembered as None so they are not retried per slide."""
+        if url not in self.contents:
+            self.contents[url] = self._download(url)
+            if self.cache is not None:
+                self.cache.save()
+        return self.contents[url]
+
+    def release(self, urls):
+        """Forgets the bytes of `urls`; a later get() fetches them again."""
+        for url in urls:
+            self.contents.pop(url, None)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,116 @@
+import hashlib
+import math
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+EMU_PER_INCH = 914400
+ORIENTATION_TAG = 0x0112
+
+
+class ImagePreparer:
+    """Fits downloaded photos and flags to the box they fill on a slide.
+
+    Each image is decoded once, centre-cropped to the box's aspect ratio (cover
+    scaling, so it is never stretched), scaled down to `dpi` at its on-slide
+    size and re-encoded: JPEG for opaque pictures, PNG for images with
+    transparency or a palette, like most flags. The most recently used results
+    are memoized by the image bytes and box size, so a flag shared by many
+    players is prepared once and its identical bytes become one image part in
+    the deck, while each player's photo soon drops out of the memo instead of
+    piling up over the roster.
+
+    Parameters:
+    - dpi: Resolution of the prepared image at its size on the slide.
+    - jpeg_quality: Quality of the re-encoded JPEGs.
+    - max_entries: Number of prepared images kept in the memo.
+    """
+
+    def __init__(self, dpi=150, jpeg_quality=85, max_entries=32):
+        self.dpi = dpi
+        self.jpeg_quality = jpeg_quality
+        self.max_entries = max_entries
+        self._prepared = OrderedDict()
+
+    def prepare(self, content, width, height):
+        """Returns the bytes to embed for `content` in a `width` x `height` EMU box.
+
+        Images PIL cannot decode are returned unchanged."""
+        key = (hashlib.sha1(content).hexdigest(), width, height)
+        if key in self._prepared:
+            self._prepared.move_to_end(key)
+            return self._prepared[key]
+
+        try:
+            prepared = self._prepare(content, width, height)
+        except Exception as e:
+            print(f"Could not prepare image, embedding it as is: {e}")
+            prepared = content
+        self._prepared[key] = prepared
+        if len(self._prepared) > self.max_entries:
+            self._prepared.popitem(last=False)
+        return prepared
+
+    def _cover_box(self, size, width, height):
+        """Returns the largest centred (left, top, width, height) with the box's aspect ratio."""
+        box_ratio = width / height
+        img_w, img_h = size
+        if img_w / img_h > box_ratio:
+            crop_w, crop_h = round(img_h * box_ratio), img_h
+        else:
+            crop_w, crop_h = img_w, round(img_w / box_ratio)
+        return (img_w - crop_w) // 2, (img_h - crop_h) // 2, crop_w, crop_h
+
+    def _target_size(self, crop_w, crop_h, width, height):
+        # Never scale up; a small picture is only cropped
+        return (
+            max(1, min(crop_w, round(width * self.dpi / EMU_PER_INCH))),
+            max(1, min(crop_h, round(height * self.dpi / EMU_PER_INCH))),
+        )
+
+    def _prepare(self, content, width, height):
+        image = Image.open(BytesIO(content))
+
+        # Size as displayed, after the EXIF orientation turns it by 90 degrees
+        size = image.size
+        if image.getexif().get(ORIENTATION_TAG) in (5, 6, 7, 8):
+            size = size[::-1]
+        _, _, crop_w, crop_h = self._cover_box(size, width, height)
+        target = self._target_size(crop_w, crop_h, width, height)
+        if (crop_w, crop_h) == size == target:
+            return content
+
+        # JPEGs can be decoded straight at a fraction of their size
+        scale = max(target[0] / crop_w, target[1] / crop_h)
+        image.draft(
+            image.mode,
+            (math.ceil(image.width * scale), math.ceil(image.height * scale)),
+        )
+        image = ImageOps.exif_transpose(image)
+
+        left, top, crop_w, crop_h = self._cover_box(image.size, width, height)
+        target = self._target_size(crop_w, crop_h, width, height)
+
+        transparent = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        keep_palette = image.mode in ("P", "1") and not transparent
+        if transparent:
+            image = image.convert("RGBA")
+        elif image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image = image.resize(
+            target, Image.LANCZOS, box=(left, top, left + crop_w, top + crop_h)
+        )
+
+        buffer = BytesIO()
+        if transparent or keep_palette:
+            image.save(buffer, format="PNG", optimize=True)
+        else:
+            image.save(
+                buffer,
+                format="JPEG",
+                quality=self.jpeg_quality,
+                optimize=True,
+                dpi=(self.dpi, self.dpi),
+            )
+        return buffer.getvalue()
@@ -0,0 +1,171 @@
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+import pandas as pd
+
+try:
+    import psutil
+
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+MB = 1024 * 1024
+
+
+def current_rss():
+    """Returns the resident set size of this process in bytes, or None if unknown."""
+    if HAS_PSUTIL:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def open_figures():
+    """Returns the number of figures pyplot holds open (0 if pyplot is not loaded)."""
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    return len(pyplot.get_fignums()) if pyplot is not None else 0
+
+
+def live_dataframes():
+    """Returns the number of DataFrames still referenced anywhere in the process."""
+    return sum(isinstance(obj, pd.DataFrame) for obj in gc.get_objects())
+
+
+class MemoryBudgetExceeded(RuntimeError):
+    """Raised by MemoryMonitor.record() when the process outgrows its budget."""
+
+
+class MemoryMonitor:
+    """Records the memory a deck build holds after each player.
+
+    Every record() stores the RSS, the Python heap traced by tracemalloc, their
+    growth since the previous player, the figures pyplot holds open and the
+    DataFrames still alive. Counting the DataFrames walks every object the
+    garbage collector tracks, and tracemalloc slows allocation down, so the
+    monitor is a diagnostic mode rather than something to leave on.
+
+    Parameters:
+    - budget_mb: RSS (or traced heap, without an RSS reading) in MB above which
+      record() raises MemoryBudgetExceeded with report() as its message.
+    - trace_python: Start tracemalloc to account the Python heap and list the
+      lines that allocated the most in report().
+    - top: Number of allocation sites listed in report().
+    """
+
+    def __init__(self, budget_mb=None, trace_python=True, top=10):
+        self.budget_mb = budget_mb
+        self.trace_python = trace_python
+        self.top = top
+        self.records = []
+        self._started = False
+        self._owns_tracing = False
+        self._rss = None
+        self._traced = 0
+
+    def start(self):
+        """Takes the baseline; record() calls it if it was not called before."""
+        if self._started:
+            return
+        self._started = True
+        if self.trace_python and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        self._rss = current_rss()
+        self._traced = self._traced_memory()
+
+    def _traced_memory(self):
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    def record(self, player):
+        """Records the memory held after `player`'s slides were built."""
+        self.start()
+        rss = current_rss()
+        traced = self._traced_memory()
+        entry = {
+            "player": player,
+            "rss": rss,
+            "rss_delta": rss - self._rss if rss is not None and self._rss else None,
+            "traced": traced,
+            "traced_delta": traced - self._traced,
+            "open_figures": open_figures(),
+            "live_dataframes": live_dataframes(),
+        }
+        self.records.append(entry)
+        self._rss, self._traced = rss, traced
+
+        if self.budget_mb is not None:
+            used = rss if rss is not None else traced
+            if used > self.budget_mb * MB:
+                raise MemoryBudgetExceeded(
+                    f"Memory budget of {self.budget_mb} MB exceeded after {player} "
+                    f"({used / MB:.0f} MB)\n{self.report()}"
+                )
+        return entry
+
+    def report(self, last=5):
+        """Returns a text report of the growth so far, its largest allocation
+        sites and the `last` records."""
+        if not self.records:
+            return "No players recorded"
+
+        first, latest = self.records[0], self.records[-1]
+        lines = [f"Players recorded: {len(self.records)}"]
+        if first["rss"] is not None:
+            growth = latest["rss"] - first["rss"]
+            lines.append(
+                f"RSS: {first['rss'] / MB:.1f} MB after the first player, "
+                f"{latest['rss'] / MB:.1f} MB now "
+                f"({growth / max(1, len(self.records) - 1) / 1024:.1f} KB per player)"
+            )
+        if tracemalloc.is_tracing():
+            lines.append(
+                f"Python heap: {first['traced'] / MB:.1f} MB -> "
+                f"{latest['traced'] / MB:.1f} MB"
+            )
+        lines.append(
+            f"Open pyplot figures: {latest['open_figures']}, "
+            f"live DataFrames: {latest['live_dataframes']}"
+        )
+
+        if tracemalloc.is_tracing() and self.top:
+            lines.append("Largest allocation sites:")
+            stats = tracemalloc.take_snapshot().statistics("lineno")
+            for stat in stats[: self.top]:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"  {stat.size / MB:8.2f} MB {stat.count:>8} blocks  "
+                    f"{frame.filename}:{frame.lineno}"
+                )
+
+        lines.append(f"Last {min(last, len(self.records))} players:")
+        for entry in self.records[-last:]:
+            rss_delta = entry["rss_delta"]
+            lines.append(
+                f"  {entry['player']}: RSS "
+                + (f"{rss_delta / 1024:+.0f} KB" if rss_delta is not None else "n/a")
+                + f", heap {entry['traced_delta'] / 1024:+.0f} KB, "
+                f"{entry['open_figures']} figures, "
+                f"{entry['live_dataframes']} DataFrames"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, filename):
+        """Writes the records as JSON, one entry per player."""
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(
+                {"budget_mb": self.budget_mb, "players": self.records}, f, indent=1
+            )
+
+    def stop(self):
+        """Stops tracemalloc if this monitor started it."""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        self._started = False
@@ -0,0 +1,117 @@
+from chart_model import spline_trend
+from PIL import ImageColor
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import (
+    XL_CHART_TYPE,
+    XL_LABEL_POSITION,
+    XL_LEGEND_POSITION,
+    XL_MARKER_STYLE,
+    XL_TICK_LABEL_POSITION,
+)
+from pptx.enum.dml import MSO_LINE_DASH_STYLE
+from pptx.util import Pt
+
+# Points of the spline trend series; PowerPoint smooths the line between them
+TREND_POINTS = 100
+
+
+def _rgb(color):
+    """Returns the RGBColor of a CSS colour name such as CHART_STYLE's "green"."""
+    return RGBColor(*ImageColor.getrgb(color))
+
+
+def _style_axes(chart, title, axis_title):
+    chart.has_title = True
+    chart.chart_title.text_frame.text = title
+    chart.chart_title.text_frame.paragraphs[0].font.size = Pt(14)
+
+    value_axis = chart.value_axis
+    value_axis.has_major_gridlines = False
+    value_axis.has_title = True
+    value_axis.axis_title.text_frame.text = axis_title
+    value_axis.axis_title.text_frame.paragraphs[0].font.size = Pt(11)
+    value_axis.tick_labels.font.size = Pt(10)
+
+
+def add_bar_chart(slide, left, top, width, height, dates, scores, style):
+    """Adds the bar chart of every century as a native chart, labelled with its score.
+
+    The years are the category labels, in place of the PNG's labels inside the bars."""
+    chart_data = CategoryChartData(number_format="0")
+    chart_data.categories = [str(date) for date in dates]
+    chart_data.add_series("Scores", scores)
+    chart = slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, left, top, width, height, chart_data
+    ).chart
+
+    _style_axes(chart, style["bar_title"], "Runs Scored")
+    chart.has_legend = False
+    chart.value_axis.minimum_scale = 0
+    chart.category_axis.tick_labels.font.size = Pt(10)
+
+    plot = chart.plots[0]
+    plot.gap_width = 25  # Same 0.8 bar width as the PNG
+    fill = plot.series[0].format.fill
+    fill.solid()
+    fill.fore_color.rgb = _rgb(style["bar_color"])
+
+    # Score on top of each bar
+    plot.has_data_labels = True
+    labels = plot.data_labels
+    labels.position = XL_LABEL_POSITION.OUTSIDE_END
+    labels.font.size = Pt(12)
+    labels.font.bold = True
+    labels.font.color.rgb = _rgb(style["bar_color"])
+    return chart
+
+
+def add_scatter_chart(slide, left, top, width, height, scores, style):
+    """Adds every century as a point plus a spline trend line, as a native chart."""
+    chart_data = XyChartData()
+    points = chart_data.add_series("Scores", number_format="0")
+    for x, score in enumerate(scores):
+        points.add_data_point(x, score)
+
+    smoothed = spline_trend(scores, TREND_POINTS)
+    has_trend = smoothed is not None
+    if has_trend:
+        x_smooth, y_smooth = smoothed
+        trend = chart_data.add_series("Trend Line")
+        for xi, yi in zip(x_smooth, y_smooth):
+            trend.add_data_point(round(float(xi), 4), round(float(yi), 4))
+
+    chart = slide.shapes.add_chart(
+        XL_CHART_TYPE.XY_SCATTER, left, top, width, height, chart_data
+    ).chart
+
+    _style_axes(chart, style["scatter_title"], "Total Centuries")
+    x_axis = chart.category_axis
+    x_axis.tick_label_position = XL_TICK_LABEL_POSITION.NONE
+    x_axis.has_major_gridlines = False
+    x_axis.minimum_scale = -0.5
+    x_axis.maximum_scale = len(scores) - 0.5
+
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.TOP
+    chart.legend.include_in_layout = False
+    chart.legend.font.size = Pt(10)
+
+    series = chart.plots[0].series
+    marker = series[0].marker
+    marker.style = XL_MARKER_STYLE.CIRCLE
+    marker.size = 10
+    marker.format.fill.solid()
+    marker.format.fill.fore_color.rgb = _rgb(style["scatter_color"])
+    marker.format.line.color.rgb = RGBColor(0, 0, 0)
+
+    if has_trend:
+        trend = series[1]
+        trend.marker.style = XL_MARKER_STYLE.NONE
+        # XySeries has no smooth property, unlike LineSeries
+        trend._element.get_or_add_smooth().val = True
+        line = trend.format.line
+        line.color.rgb = _rgb(style["trend_color"])
+        line.dash_style = MSO_LINE_DASH_STYLE.DASH
+        line.width = Pt(2)
+    return chart
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class PlayerDataStore:
+    """Per-player views over the centuries and personal data, indexed once.
+
+    Both frames are reordered so that every player's rows are contiguous, and the
+    start/stop offsets of each player are kept. Looking up a player is then a
+    dictionary hit plus a positional slice, which pandas returns as a view
+    instead of scanning and copying the whole frame with a boolean mask.
+    """
+
+    def __init__(self, data, personal_data):
+        self.data, self._data_offsets = self._index(data, ["gender", "name"])
+        self.personal_data, self._personal_offsets = self._index(
+            personal_data, ["Name"]
+        )
+
+        # Players per gender, in the order they first appear in the data
+        self._players = {}
+        for gender, name in self._data_offsets:
+            self._players.setdefault(gender, []).append(name)
+
+    def _index(self, frame, keys):
+        """Returns `frame` grouped into contiguous rows and the (start, stop) of each key."""
+        groups = frame.groupby(keys, sort=False).indices
+        if not groups:
+            return frame.iloc[0:0], {}
+
+        positions = np.concatenate(list(groups.values()))
+        offsets = {}
+        start = 0
+        for key, rows in groups.items():
+            key = key if isinstance(key, tuple) else (key,)
+            offsets[key] = (start, start + len(rows))
+            start += len(rows)
+        return frame.iloc[positions], offsets
+
+    def players(self, gender):
+        """Returns the names of the players of `gender`, in data order."""
+        return list(self._players.get(gender, []))
+
+    def player_frame(self, gender, name):
+        """Returns the century rows of one player, in their original order."""
+        start, stop = self._data_offsets.get((gender, name), (0, 0))
+        return self.data.iloc[start:stop]
+
+    def personal_info(self, name):
+        """Returns the personal data rows of one player (empty if unknown)."""
+        start, stop = self._personal_offsets.get((name,), (0, 0))
+        return self.personal_data.iloc[start:stop]
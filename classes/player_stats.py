@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+
+class PlayerStats:
+    """Everything the slides show about one player's centuries, precomputed.
+
+    - name, countries: The player and the countries they scored for, in the
+      order they first appear.
+    - total: Number of centuries.
+    - years, year_counts: Each year with a century and how many were scored.
+    - top_score, top_years: Highest score and the year of every century with it.
+    - formats: Centuries per match format, e.g. {"Test": 29}.
+    - longest_streak: Most consecutive calendar years with a century.
+    - undated: True if some centuries have no parsed year. pandas then holds the
+      years as floats, and the tables show them (and their counts) as such.
+    """
+
+    __slots__ = (
+        "name",
+        "countries",
+        "total",
+        "years",
+        "year_counts",
+        "top_score",
+        "top_years",
+        "formats",
+        "longest_streak",
+        "undated",
+    )
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields[field])
+
+    def _dtype(self, values):
+        return np.result_type(np.float64 if self.undated else np.int64, values.dtype)
+
+    def score_table(self):
+        """Returns the (header, columns) of the centuries-per-year table."""
+        dtype = self._dtype(self.year_counts)
+        return ["Year", "Centuries"], [
+            self.years.astype(dtype),
+            self.year_counts.astype(dtype),
+        ]
+
+    def top_table(self):
+        """Returns the (header, columns) of the top score table."""
+        dtype = self._dtype(np.asarray([self.top_score]))
+        return ["Top Year", "Top Run"], [
+            self.top_years.astype(dtype),
+            np.full(len(self.top_years), self.top_score, dtype=dtype),
+        ]
+
+
+def _split(values, codes, players):
+    """Splits `values`, grouped by the sorted player `codes`, into one array per player."""
+    return np.split(values, np.searchsorted(codes, np.arange(1, players)))
+
+
+def player_stats(frames, names):
+    """Returns the PlayerStats of each player frame, in order, in one grouped pass.
+
+    Each frame holds one player's centuries sorted by their year `date`, as
+    PowerPointGenerator._prepare_player_df returns them; the frames are
+    concatenated column by column and every metric is computed over all of them
+    at once."""
+    players = len(frames)
+    lengths = np.array([len(frame) for frame in frames], dtype=np.int64)
+    codes = np.repeat(np.arange(players), lengths)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+    def column(name):
+        if not frames:
+            return np.array([])
+        return np.concatenate([frame[name].to_numpy() for frame in frames])
+
+    years = column("date").astype(np.float64)
+    scores = column("Score")
+    rows = pd.DataFrame({"code": codes, "year": years, "country": column("country")})
+    if frames and all("Format" in frame.columns for frame in frames):
+        rows["Format"] = column("Format")
+
+    undated = np.bincount(codes[np.isnan(years)], minlength=players) > 0
+
+    # Centuries per player-year (rows without a year are left out, like groupby)
+    per_year = rows.groupby(["code", "year"]).size()
+    year_codes = per_year.index.get_level_values("code").to_numpy()
+    year_values = per_year.index.get_level_values("year").to_numpy()
+    year_lists = _split(year_values, year_codes, players)
+    count_lists = _split(per_year.to_numpy(), year_codes, players)
+
+    # Longest run of consecutive years, over the sorted player-year pairs
+    new_run = np.ones(len(year_values), dtype=bool)
+    new_run[1:] = (year_codes[1:] != year_codes[:-1]) | (
+        year_values[1:] - year_values[:-1] != 1
+    )
+    run_lengths = np.diff(np.append(np.flatnonzero(new_run), len(year_values)))
+    longest_streak = np.zeros(players, dtype=np.int64)
+    np.maximum.at(longest_streak, year_codes[new_run], run_lengths)
+
+    # Top score and the year of every century that reached it
+    top_scores = (
+        np.maximum.reduceat(scores, starts[lengths > 0])
+        if len(scores)
+        else np.array([], dtype=scores.dtype)
+    )
+    player_top = np.zeros(players, dtype=scores.dtype)
+    player_top[lengths > 0] = top_scores
+    is_top = scores == np.repeat(player_top, lengths)
+    top_year_lists = _split(years[is_top], codes[is_top], players)
+
+    countries = rows.drop_duplicates(["code", "country"])
+    country_lists = _split(
+        countries["country"].to_numpy(), countries["code"].to_numpy(), players
+    )
+
+    formats = [{} for _ in range(players)]
+    if "Format" in rows.columns:
+        for (code, match_format), count in (
+            rows.groupby(["code", "Format"]).size().items()
+        ):
+            formats[code][match_format] = int(count)
+
+    return [
+        PlayerStats(
+            name=names[idx],
+            countries=country_lists[idx],
+            total=int(lengths[idx]),
+            years=year_lists[idx],
+            year_counts=count_lists[idx],
+            top_score=player_top[idx],
+            top_years=top_year_lists[idx],
+            formats=formats[idx],
+            longest_streak=int(longest_streak[idx]),
+            undated=bool(undated[idx]),
+        )
+        for idx in range(players)
+    ]
+
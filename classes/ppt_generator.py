@@ -1,18 +1,112 @@
+import hashlib
+import importlib.metadata
 import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from custom_presentation import CustomPresentation
-import plotly.graph_objects as go
-import matplotlib.ticker as mticker
-from scipy.interpolate import make_interp_spline
+from chart_model import chart_model, chart_models, spline_trend
+from custom_presentation import CHART_BACKENDS, DECORATION_MODES, CustomPresentation
+from html_dashboard import build_dashboard_html
+from date_normalizer import DateNormalizer
+from image_cache import ImageCache
+from image_fetcher import ImageFetcher
+from image_preparer import ImagePreparer
+from player_data_store import PlayerDataStore
+from player_stats import player_stats
+from render_cache import RenderCache
+from tracing import NULL_TRACER
 import datetime as dt
 
+# Everything that shapes the rendered charts. It is part of the render-cache key,
+# so changing a value here re-renders every player.
+CHART_STYLE = {
+    "figsize": (20, 6),
+    "bar_title": "Centuries Scored Over the Years (Bar Chart)",
+    "scatter_title": "Total Centuries Per Year (Scatter + Trend)",
+    "bar_color": "green",
+    "scatter_color": "blue",
+    "trend_color": "red",
+    "html_height": 500,
+    # Fixed subplot margins of the PNG charts, as tight_layout lays out a 20x6 figure
+    "margins": {"left": 0.036, "right": 0.9925, "bottom": 0.04, "top": 0.94},
+}
+# "pages" writes one HTML file per player, "dashboard" one index.html per deck
+HTML_MODES = ("pages", "dashboard")
+# Players whose photos are held in memory at once when streaming a deck
+STREAM_PREFETCH_WINDOW = 64
+
+# Columns the info and chart slides read; a change in any of them rebuilds the slides
+SLIDE_COLUMNS = ["date", "Score", "country"]
+INFO_COLUMNS = [
+    "Country",
+    "Image",
+    "Flag",
+    "DOB",
+    "Birth Place",
+    "Mother",
+    "Father",
+    "Height",
+    "Marital Status",
+    "Retired",
+]
+
+
+def _chart_params():
+    """Returns CHART_STYLE plus the versions of the libraries drawing the charts.
+
+    The versions are read from the installed package metadata, so building the
+    render-cache key does not import matplotlib, plotly or scipy."""
+    version = importlib.metadata.version
+    return {
+        **CHART_STYLE,
+        "versions": [
+            version("matplotlib"),
+            version("plotly"),
+            version("scipy"),
+            np.__version__,
+        ],
+    }
+
 
 class PowerPointGenerator:
-    def __init__(self, data, personal_data):
+    def __init__(
+        self,
+        data,
+        personal_data,
+        image_fetcher=None,
+        render_cache=None,
+        image_preparer=None,
+        tracer=None,
+        memory_monitor=None,
+    ):
+        if data is not None and "parsed_date" not in data.columns:
+            # Parse the mixed-format dates once, instead of once per player
+            normalizer = DateNormalizer()
+            data = normalizer.normalize(data)
+            print(normalizer.report())
         self.data = data
         self.personal_data = personal_data
+        # Worker processes only render charts and are built without data
+        self.store = (
+            PlayerDataStore(data, personal_data) if data is not None else None
+        )
+        self.image_fetcher = image_fetcher or ImageFetcher(cache=ImageCache())
+        self.render_cache = render_cache or RenderCache()
+        self.image_preparer = image_preparer or ImagePreparer()
+        self.tracer = tracer or NULL_TRACER
+        self.memory_monitor = memory_monitor
+        self.chart_params = _chart_params()
+        self._chart_renderer = None
+
+    @property
+    def chart_renderer(self):
+        """The matplotlib renderer; matplotlib is only imported once a PNG is drawn."""
+        if self._chart_renderer is None:
+            from chart_renderer import MatplotlibChartRenderer
+
+            self._chart_renderer = MatplotlibChartRenderer(CHART_STYLE)
+        return self._chart_renderer
 
     def format_number(self, value):
         """
@@ -29,98 +123,28 @@ class PowerPointGenerator:
         else:
             return f"{value:.2f}"  # Format to 2 decimal places if the value is a float
 
-    def plot_time_series(self, data_grouped, filename):
+    def plot_time_series(self, data_grouped, filename, chart=None):
         # Define filenames for saving
         filename_a = f"{filename}_a.png"
         filename_b = f"{filename}_b.png"
+        chart = chart or chart_model(data_grouped)
 
-        x_values = range(len(data_grouped))
-        # Create and save the bar plot
-        plt.figure(figsize=(20, 6))  # Twice as wide
-        bars = plt.bar(x_values, data_grouped["Score"], color="green")
-        plt.ylabel("Runs Scored")
-        plt.title("Centuries Scored Over the Years (Bar Chart)")
-        plt.xlim(-0.5, len(data_grouped) - 0.5)  # Remove extra padding
-        plt.gca().yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
-        plt.xticks([])  # Remove x-axis labels\
-        plt.tight_layout()  # Optimize spacing
-
-        for i, (bar, year, score) in enumerate(
-            zip(bars, data_grouped["date"], data_grouped["Score"])
-        ):
-            # Annotate score on top of the bar
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + 0.5,
-                str(score),
-                ha="center",
-                va="bottom",
-                fontsize=12,
-                fontweight="bold",
-                color="green",
-            )
-
-            # Annotate year inside the bar (rotated, at bottom)
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() * 0.1,
-                str(year),
-                ha="center",
-                va="bottom",
-                fontsize=12,
-                color="white",
-                rotation=90,
-            )
-
-        plt.figure(figsize=(20, 6))  # Twice as wide
-        y_values = data_grouped["Score"]
-
-        # Scatter points
-        plt.scatter(
-            x_values, y_values, color="blue", label="Scores", s=100, edgecolors="black"
-        )
-
-        # Smooth trend line (LOESS-style)
-        if len(x_values) > 2:
-            x_smooth = np.linspace(
-                min(x_values), max(x_values), 300
-            )  # More points for smoothness
-            y_smooth = make_interp_spline(x_values, y_values, k=3)(
-                x_smooth
-            )  # Cubic spline interpolation
-            plt.plot(
-                x_smooth,
-                y_smooth,
-                color="red",
-                linestyle="--",
-                linewidth=2,
-                label="Trend Line",
-            )
-
-        plt.ylabel("Total Centuries")
-        plt.title("Total Centuries Per Year (Scatter + Trend)")
-        plt.xticks([])  # Remove x-axis labels
-        plt.xlim(-0.5, len(data_grouped) - 0.5)  # Remove extra padding
-        plt.gca().yaxis.set_major_locator(
-            mticker.MaxNLocator(integer=True)
-        )  # Ensure whole numbers
-        plt.legend()
-        plt.tight_layout()
-
-        # Ensure directory exists before saving
-        os.makedirs(os.path.dirname(filename_b), exist_ok=True)
-        plt.savefig(filename_b)
-        plt.close()
+        # Bar plot of every century, then scatter plot with its trend line
+        self.chart_renderer.render_bar(chart, filename_a)
+        self.chart_renderer.render_scatter(chart, filename_b)
 
         return filename_a, filename_b
 
     def create_graph_html_from_scores(
-        self, data_grouped, slideName, key, combined_file_name
+        self, data_grouped, slideName, key, combined_file_name, chart=None
     ):
+        import plotly.graph_objects as go
+
         # Prepare data
-        x = list(range(len(data_grouped)))
-        dates = data_grouped["date"].tolist()
-        scores = data_grouped["Score"].tolist()
+        chart = chart or chart_model(data_grouped)
+        x = chart.x.tolist()
+        dates = chart.dates
+        scores = chart.scores
 
         # First Plot: Bar chart with annotations (Score + Year)
         fig1 = go.Figure()
@@ -133,7 +157,7 @@ class PowerPointGenerator:
                 text=[str(score) for score in scores],
                 textposition="outside",
                 name="Scores",
-                marker=dict(color="green"),
+                marker=dict(color=CHART_STYLE["bar_color"]),
                 hovertemplate="<b>%{customdata}</b><br>Score: %{y}<extra></extra>",
                 customdata=dates,
             )
@@ -153,12 +177,12 @@ class PowerPointGenerator:
             )
 
         fig1.update_layout(
-            title="Centuries Scored Over the Years (Bar Chart)",
+            title=CHART_STYLE["bar_title"],
             xaxis=dict(title="", showticklabels=False),
             yaxis=dict(title="Runs Scored", tickmode="linear", dtick=1),
             bargap=0.2,
             margin=dict(t=60, b=30),
-            height=500,
+            height=CHART_STYLE["html_height"],
         )
 
         # Second Plot: Scatter + smooth trend line
@@ -170,34 +194,35 @@ class PowerPointGenerator:
                 x=x,
                 y=scores,
                 mode="markers",
-                marker=dict(size=10, color="blue", line=dict(width=1, color="black")),
+                marker=dict(
+                    size=10,
+                    color=CHART_STYLE["scatter_color"],
+                    line=dict(width=1, color="black"),
+                ),
                 name="Scores",
                 hovertemplate="<b>%{customdata}</b><br>Score: %{y}<extra></extra>",
                 customdata=dates,
             )
         )
 
-        # LOESS-style trend line using cubic spline interpolation (like make_interp_spline)
-        if len(x) > 2:
-            from scipy.interpolate import make_interp_spline
-
-            x_smooth = np.linspace(min(x), max(x), 300)
-            y_smooth = make_interp_spline(x, scores, k=3)(x_smooth)
+        # LOESS-style trend line, the same spline as in the PNG
+        if chart.trend is not None:
+            x_smooth, y_smooth = chart.trend
             fig2.add_trace(
                 go.Scatter(
                     x=x_smooth,
                     y=y_smooth,
                     mode="lines",
                     name="Trend Line",
-                    line=dict(color="red", dash="dash"),
+                    line=dict(color=CHART_STYLE["trend_color"], dash="dash"),
                 )
             )
 
         fig2.update_layout(
-            title="Total Centuries Per Year (Scatter + Trend)",
+            title=CHART_STYLE["scatter_title"],
             xaxis=dict(title="", showticklabels=False),
             yaxis=dict(title="Total Centuries", tickmode="linear", dtick=1),
-            height=500,
+            height=CHART_STYLE["html_height"],
             margin=dict(t=60, b=30),
             legend=dict(
                 orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
@@ -246,6 +271,35 @@ class PowerPointGenerator:
             </div>
             """)
 
+    def _dashboard_series(self, player_df):
+        """Returns the compact series the dashboard builds a player's figures from."""
+        scores = player_df["Score"].tolist()
+        series = {
+            "dates": [str(date) for date in player_df["date"]],
+            "scores": scores,
+            "trend": None,
+        }
+
+        trend = spline_trend(scores)
+        if trend is not None:
+            series["trend"] = [round(float(y), 3) for y in trend[1]]
+
+        return series
+
+    def create_dashboard_html(self, players, key, filename):
+        """Writes one offline HTML page holding the charts of every player in a deck.
+
+        plotly.js is inlined once and each player's figures are only built when the
+        page is opened at `index.html#<player>`."""
+        from plotly.offline import get_plotlyjs
+
+        self._create_directory_for_file(filename)
+        html = build_dashboard_html(
+            key, players, CHART_STYLE, dt.datetime.now().date(), get_plotlyjs()
+        )
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(html)
+
     def _create_directory_for_file(self, filename):
         dir_name = os.path.dirname(filename)
         if not os.path.exists(dir_name) and dir_name:
@@ -276,67 +330,365 @@ class PowerPointGenerator:
 
         return top_warranty_sub_drivers
 
-    def _handle_general_flow(self, key, name):
-        prs = CustomPresentation(key, name)
+    def _prepare_player_df(self, gender, player):
+        """Returns the player's rows with a year `date` column, sorted by year."""
+        player_df = self.store.player_frame(gender, player).copy()
 
-        total_issues = []
+        # The year parsed at load; floats only when some of the player's are missing
+        years = player_df["year"]
+        player_df["date"] = (
+            years.astype("float64") if years.hasnans else years.astype("int32")
+        )
+        return player_df.sort_values(by="date").reset_index(drop=True)
+
+    def _asset_paths(self, slide_name, key):
+        """Returns the paths of the two chart images and the HTML page of a player."""
+        filename = f"graphs/{key}/{slide_name}/{slide_name}"
+        return (
+            f"{filename}_a.png",
+            f"{filename}_b.png",
+            f"PPTS/assets/{key}/{slide_name}.html",
+        )
 
-        filtered_Data = self.data[self.data["gender"] == name]
-        players = filtered_Data["name"].unique()
+    def _html_link(self, slide_name, key, html_mode):
+        """Returns the slide hyperlink (relative to the deck) to a player's charts."""
+        if html_mode == "dashboard":
+            return f"assets/{key}/index.html#{quote(slide_name)}"
+        return f"assets/{key}/{slide_name}.html"
 
+    def render_player_assets(
+        self, player_df, slide_name, key, write_html=True, write_png=True, chart=None
+    ):
+        """Renders the PNG charts and the interactive HTML page of one player.
+
+        The HTML page is skipped when `write_html` is false (dashboard mode), and
+        the PNGs when `write_png` is false (native charts). Both are drawn from one
+        ChartModel, `chart` when given. Returns the chart image paths in the order
+        they are placed on the slide, or Nones without PNGs."""
+        filename_a, filename_b = None, None
+        if (write_png or write_html) and chart is None:
+            chart = chart_model(player_df)
+
+        if write_png:
+            with self.tracer.span("plot_time_series", player=slide_name, key=key):
+                filename_a, filename_b = self.plot_time_series(
+                    player_df,
+                    filename=f"graphs/{key}/{slide_name}/{slide_name}",
+                    chart=chart,
+                )
+
+        if write_html:
+            with self.tracer.span(
+                "create_graph_html_from_scores", player=slide_name, key=key
+            ):
+                self.create_graph_html_from_scores(
+                    player_df,
+                    slide_name,
+                    key,
+                    self._asset_paths(slide_name, key)[2],
+                    chart=chart,
+                )
+
+        return filename_a, filename_b
+
+    def _iter_player_assets(self, jobs, workers):
+        """Yields the chart image paths of each job, in job order.
+
+        Players whose chart inputs match the render cache reuse the files on disk.
+        The rest are rendered in a process pool when `workers` > 1, otherwise one
+        at a time in this process."""
+        entries = []
+        with self.tracer.span("render_cache_lookup", players=len(jobs)) as span:
+            for player_df, slide_name, key, write_html, write_png in jobs:
+                digest = self.render_cache.digest(
+                    player_df,
+                    {
+                        **self.chart_params,
+                        "write_html": write_html,
+                        "write_png": write_png,
+                    },
+                )
+                paths = self._asset_paths(slide_name, key)
+                expected = (paths[:2] if write_png else ()) + (
+                    paths[2:] if write_html else ()
+                )
+                hit = self.render_cache.lookup(f"{key}/{slide_name}", digest, expected)
+                entries.append((slide_name, key, digest, hit, write_png))
+            span.set(hits=sum(entry[3] for entry in entries))
+
+        misses = [job for job, entry in zip(jobs, entries) if not entry[3]]
+        # The chart series and trends of every player to render, in one batch
+        charts = chart_models([job[0] for job in misses])
+        misses = [job + (chart,) for job, chart in zip(misses, charts)]
+
+        if not workers or workers <= 1 or not misses:
+            yield from self._merge_cached_assets(entries, self._render_serially(misses))
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = executor.map(_render_player_assets, misses)
+            yield from self._merge_cached_assets(entries, rendered)
+
+    def _render_serially(self, jobs):
+        """Renders `jobs` in order, letting go of each job once it is rendered."""
+        jobs.reverse()
+        while jobs:
+            yield self.render_player_assets(*jobs.pop())
+
+    def _merge_cached_assets(self, entries, rendered):
+        """Interleaves cache hits with the freshly `rendered` misses, in order."""
+        for slide_name, key, digest, hit, write_png in entries:
+            if hit:
+                if write_png:
+                    yield self._asset_paths(slide_name, key)[:2]
+                else:
+                    yield None, None
+            else:
+                # Covers the rendering itself, or the wait for a worker process
+                with self.tracer.span("render_assets", player=slide_name, key=key):
+                    assets = next(rendered)
+                self.render_cache.record(f"{key}/{slide_name}", digest)
+                yield assets
+
+    def _prefetch_player_images(self, players):
+        """Downloads every distinct photo and flag of `players` before the slides are built."""
+        urls = []
         for player in players:
-            # product represents one slide of the PPT
-            slide_name = player
-            print("Slide Name: " + slide_name)
+            player_info = self.store.personal_info(player)
+            urls += player_info["Image"].tolist() + player_info["Flag"].tolist()
+        with self.tracer.span("prefetch_images", urls=len(urls)):
+            self.image_fetcher.prefetch(urls)
 
-            # Filter Calls Data
-            player_df = filtered_Data[filtered_Data["name"] == player]
+    def _slide_digest(
+        self, player_df, player_info, html_link, decoration, chart_backend
+    ):
+        """Returns a short hash of the data a player's info and chart slides show."""
+        payload = (
+            player_df[SLIDE_COLUMNS].to_json(orient="values")
+            + player_info[INFO_COLUMNS].to_json(orient="values")
+            + html_link
+            + decoration
+            + chart_backend
+            + f"{self.image_preparer.dpi}/{self.image_preparer.jpeg_quality}"
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
-            # Ensure date column is in datetime format and extract the year
-            player_df = player_df.copy()
-            player_df.loc[:, "date"] = pd.to_datetime(
-                player_df["Date"], errors="coerce"
-            ).dt.year
-            player_df = player_df.sort_values(by="date").reset_index(drop=True)
-            player_info = self.personal_data[self.personal_data["Name"] == slide_name]
+    def _open_presentation(
+        self, key, name, ppt_name, update, decoration, stream=False, chart_backend="png"
+    ):
+        """Returns the deck to build and the player slides it already holds.
 
-            filename_a, filename_b = self.plot_time_series(
-                player_df,
-                filename=f"graphs/{key}/{slide_name}/{slide_name}",
+        In update mode the previously generated deck is reopened; decks without
+        slide identifiers (or no deck at all) are regenerated from scratch."""
+        if update and os.path.exists(ppt_name):
+            prs = CustomPresentation(
+                key,
+                name,
+                image_fetcher=self.image_fetcher,
+                image_preparer=self.image_preparer,
+                path=ppt_name,
+                decoration=decoration,
+                chart_backend=chart_backend,
+                chart_style=CHART_STYLE,
             )
+            if prs.find_slides("intro"):
+                return prs, prs.player_slides()
+            print(f"{ppt_name} has no slide identifiers, regenerating it")
 
-            self.create_graph_html_from_scores(
-                player_df,
-                slide_name,
-                key,
-                f"PPTS/assets/{key}/{slide_name}.html",
+        prs = CustomPresentation(
+            key,
+            name,
+            image_fetcher=self.image_fetcher,
+            image_preparer=self.image_preparer,
+            decoration=decoration,
+            stream=stream,
+            chart_backend=chart_backend,
+            chart_style=CHART_STYLE,
+        )
+        return prs, {}
+
+    def _handle_general_flow(
+        self,
+        key,
+        name,
+        workers=None,
+        update=False,
+        html_mode="pages",
+        decoration="boxes",
+        stream=False,
+        chart_backend="png",
+    ):
+        """Generates PPTS/player_{key}.pptx for the players of gender `name`.
+
+        With `update`, the existing deck is patched instead: only players whose
+        data changed get new slides, players no longer in the data are removed,
+        and the aggregate slide is refreshed. `html_mode` picks one interactive
+        HTML page per player ("pages") or one per deck ("dashboard"), and
+        `decoration` random boxes on every slide ("boxes") or one shared image
+        ("band"). With `stream`, each player's slides are written to the deck as
+        soon as they are built, so memory stays flat however many players it has.
+        `chart_backend` places the matplotlib PNGs ("png") or builds native
+        PowerPoint charts ("native"), which skips matplotlib for the deck."""
+        if html_mode not in HTML_MODES:
+            raise ValueError(f"html_mode must be one of {HTML_MODES}, got {html_mode!r}")
+        if decoration not in DECORATION_MODES:
+            raise ValueError(
+                f"decoration must be one of {DECORATION_MODES}, got {decoration!r}"
+            )
+        if chart_backend not in CHART_BACKENDS:
+            raise ValueError(
+                f"chart_backend must be one of {CHART_BACKENDS}, got {chart_backend!r}"
             )
+        if stream and update:
+            raise ValueError("stream cannot be combined with update")
 
-            prs.add_player_info(slide_name, player_info, total_cen=len(player_df))
+        # The hits and misses printed at the end count this deck only
+        self.render_cache.reset_counts()
 
-            prs.add_slide(
-                slide_name,
-                [
-                    filename_a,
-                    filename_b,
-                ],
+        ppt_name = f"PPTS/player_{key}.pptx"
+        prs, existing = self._open_presentation(
+            key, name, ppt_name, update, decoration, stream, chart_backend
+        )
+
+        players = self.store.players(name)
+        if self.memory_monitor is not None:
+            self.memory_monitor.start()
+
+        jobs = []
+        player_frames = []
+        countries = []
+        player_infos = {}
+        digests = {}
+        dashboard_players = {}
+        for player in players:
+            with self.tracer.span("filter", player=player, key=key) as span:
+                player_df = self._prepare_player_df(name, player)
+                player_info = self.store.personal_info(player)
+                span.set(rows=len(player_df))
+            digest = self._slide_digest(
                 player_df,
-                f"assets/{key}/{slide_name}.html",
+                player_info,
+                self._html_link(player, key, html_mode),
+                decoration,
+                chart_backend,
             )
 
-            total_issues.append(
-                [slide_name, player_info["Country"].unique()[0], len(player_df)]
+            if html_mode == "dashboard":
+                dashboard_players[player] = self._dashboard_series(player_df)
+
+            player_frames.append(player_df)
+            countries.append(player_info["Country"].unique()[0])
+
+            if existing.get(player, {}).get("digest") == digest:
+                continue
+
+            jobs.append(
+                (player_df, player, key, html_mode == "pages", chart_backend == "png")
             )
+            player_infos[player] = player_info
+            digests[player] = digest
 
-            plt.close()
+        # Every table and total of the deck, computed over all players at once
+        with self.tracer.span("player_stats", key=key, players=len(players)):
+            stats = dict(zip(players, player_stats(player_frames, players)))
+        del player_frames
 
-        columns = ["Name", "Country", "Total Centuries"]
+        if not stream:
+            self._prefetch_player_images(list(player_infos))
 
-        prs.add_aggregate_slide(
-            key,
-            pd.DataFrame(total_issues, columns=columns),
+        assets = self._iter_player_assets(jobs, workers)
+        for idx, (job, (filename_a, filename_b)) in enumerate(zip(jobs, assets)):
+            player_df, slide_name, key = job[:3]
+            # product represents one slide of the PPT
+            print("Slide Name: " + slide_name)
+
+            if stream and idx % STREAM_PREFETCH_WINDOW == 0:
+                window = jobs[idx : idx + STREAM_PREFETCH_WINDOW]
+                self._prefetch_player_images([job[1] for job in window])
+
+            for old_slide in existing.get(slide_name, {}).get("slides", []):
+                prs.remove_slide(old_slide)
+
+            with self.tracer.span("add_player_info", player=slide_name, key=key):
+                prs.add_player_info(
+                    slide_name,
+                    player_infos[slide_name],
+                    total_cen=stats[slide_name].total,
+                    digest=digests[slide_name],
+                )
+
+            with self.tracer.span("add_slide", player=slide_name, key=key):
+                prs.add_slide(
+                    slide_name,
+                    [
+                        filename_a,
+                        filename_b,
+                    ],
+                    player_df,
+                    self._html_link(slide_name, key, html_mode),
+                    digest=digests[slide_name],
+                    stats=stats[slide_name],
+                )
+
+            if stream:
+                with self.tracer.span("flush", player=slide_name, key=key):
+                    prs.flush()
+                self.image_fetcher.release(player_infos[slide_name]["Image"].tolist())
+
+            # Drop the player's frames so they do not pile up over the deck
+            jobs[idx] = None
+            del player_infos[slide_name]
+            if self.memory_monitor is not None:
+                self.memory_monitor.record(slide_name)
+
+        current_players = set(players)
+        for player, entry in existing.items():
+            if player not in current_players:
+                print("Removed Slide: " + player)
+                for old_slide in entry["slides"]:
+                    prs.remove_slide(old_slide)
+
+        if html_mode == "dashboard":
+            self.create_dashboard_html(
+                dashboard_players, key, f"PPTS/assets/{key}/index.html"
+            )
+
+        self.render_cache.save()
+        print(
+            f"Render cache: {self.render_cache.hits} hits, "
+            f"{self.render_cache.misses} misses"
         )
 
-        ppt_name = f"PPTS/player_{key}.pptx"
+        columns = ["Name", "Country", "Total Centuries"]
+        total_issues = [
+            [player, country, stats[player].total]
+            for player, country in zip(players, countries)
+        ]
+
+        with self.tracer.span(
+            "add_aggregate_slide", key=key, players=len(total_issues)
+        ):
+            prs.add_aggregate_slide(
+                key,
+                pd.DataFrame(total_issues, columns=columns),
+            )
+
+        if existing:
+            prs.arrange_slides(players)
+
         self._create_directory_for_file(ppt_name)
-        prs.save(ppt_name)
+        with self.tracer.span("save", key=key, stream=stream) as span:
+            prs.save(ppt_name)
+            span.set(bytes=os.path.getsize(ppt_name))
+
+
+_worker_generator = None
+
+
+def _render_player_assets(job):
+    """Process-pool entry point for PowerPointGenerator.render_player_assets."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = PowerPointGenerator(data=None, personal_data=None)
+
+    return _worker_generator.render_player_assets(*job)
@@ -0,0 +1,65 @@
+import hashlib
+import json
+import os
+
+
+class RenderCache:
+    """Remembers which inputs produced the chart files already on disk.
+
+    Each rendered player is recorded under `{key}/{player}` with a hash of the
+    player's (date, Score) rows and the chart parameters. When the hash is
+    unchanged and the files still exist, the files are reused instead of being
+    rendered again.
+
+    Parameters:
+    - manifest_path: JSON file holding the recorded hashes.
+    - force: Treat every lookup as a miss, re-rendering all charts.
+    """
+
+    def __init__(self, manifest_path=".render_cache.json", force=False):
+        self.manifest_path = manifest_path
+        self.force = force
+        self._manifest = self._load_manifest()
+        self.reset_counts()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def digest(player_df, params):
+        """Returns a stable hash of the player's (date, Score) rows and `params`."""
+        rows = player_df[["date", "Score"]].to_json(orient="values")
+        payload = json.dumps([rows, params], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, entry_id, digest, paths):
+        """True if `entry_id` was rendered from `digest` and all `paths` exist."""
+        hit = (
+            not self.force
+            and self._manifest.get(entry_id) == digest
+            and all(os.path.exists(path) for path in paths)
+        )
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return hit
+
+    def reset_counts(self):
+        """Zeroes the hit and miss counts, e.g. when the next deck starts."""
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, entry_id, digest):
+        self._manifest[entry_id] = digest
+
+    def save(self):
+        """Writes the manifest to disk."""
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
@@ -0,0 +1,142 @@
+import re
+from xml.sax.saxutils import escape
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Pt
+
+TABLE_STYLE_ID = "{69012ECD-51FC-41F1-AA8D-1B2483CD663E}"
+
+# Cell formatting of each kind of table, applied per row kind instead of per cell.
+# "align" is the alignment of every column after the first (None keeps the table
+# style's); "merged" styles the optional row of merged cells above the header.
+SCORE_TABLE_STYLE = {
+    "header_size": Pt(12),
+    "body_size": Pt(11),
+    "align": None,
+}
+AGGREGATE_TABLE_STYLE = {
+    "header_size": Pt(16),
+    "body_size": Pt(14),
+    "align": "r",
+    "merged_size": Pt(16),
+    "merged_align": "ctr",
+}
+
+EMPTY_CELL = (
+    "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody><a:tcPr/></a:tc>"
+)
+
+
+def _pPr(size, align=None):
+    algn = f' algn="{align}"' if align else ""
+    return f'<a:pPr{algn}><a:defRPr sz="{size.centipoints}"/></a:pPr>'
+
+
+def _escape_ctrl_chars(text):
+    # Same plain-text escape python-pptx applies to control characters in a run
+    return re.sub(
+        r"([\x00-\x08\x0B-\x1F])", lambda match: "_x%04X_" % ord(match.group(1)), text
+    )
+
+
+def _cell(text, pPr, span=""):
+    """Returns the a:tc that `cell.text = text` plus paragraph formatting produces."""
+    paragraphs = []
+    for p_text in text.split("\n"):
+        runs = []
+        for idx, r_text in enumerate(p_text.split("\v")):
+            if idx > 0:
+                runs.append("<a:br/>")
+            if r_text:
+                runs.append(f"<a:r><a:t>{escape(_escape_ctrl_chars(r_text))}</a:t></a:r>")
+        paragraphs.append("".join(runs))
+
+    # The formatting is set on the first paragraph only
+    paragraphs[0] = pPr + paragraphs[0]
+    body = "".join(f"<a:p>{p}</a:p>" for p in paragraphs)
+    return f"<a:tc{span}><a:txBody><a:bodyPr/><a:lstStyle/>{body}</a:txBody><a:tcPr/></a:tc>"
+
+
+def _row(height, cells):
+    return f'<a:tr h="{height}">{"".join(cells)}</a:tr>'
+
+
+def table_graphic_frame(
+    shape_id, left, top, width, height, header, columns, style, merged_header=None
+):
+    """Returns a p:graphicFrame element holding a whole formatted table.
+
+    The XML is the same as python-pptx's add_table followed by setting the text,
+    font size and alignment of every cell, but it is written in one pass.
+
+    Parameters:
+    - shape_id: Id of the new shape on its slide.
+    - left, top, width, height: Position and size in EMU, split evenly across the
+      columns and rows like add_table does.
+    - header: The column names.
+    - columns: One sequence of cell values per column, written with str().
+    - style: SCORE_TABLE_STYLE, AGGREGATE_TABLE_STYLE or a dict like them.
+    - merged_header: Optional [((start_col, end_col), text)] for an extra row of
+      merged cells above the column names.
+    """
+    cols = len(header)
+    body = list(zip(*[[str(value) for value in column] for column in columns]))
+    rows = len(body) + 1 + (1 if merged_header else 0)
+
+    # add_table gives the last column and row whatever the even split leaves over
+    col_width = width // cols
+    col_widths = [col_width] * (cols - 1) + [width - (cols - 1) * col_width]
+    row_height = height // rows
+    row_heights = [row_height] * (rows - 1) + [height - (rows - 1) * row_height]
+
+    header_pPr = (_pPr(style["header_size"]), _pPr(style["header_size"], style["align"]))
+    body_pPr = (_pPr(style["body_size"]), _pPr(style["body_size"], style["align"]))
+
+    xml_rows = []
+    if merged_header:
+        cells = [EMPTY_CELL] * cols
+        merged_pPr = _pPr(style["merged_size"], style["merged_align"])
+        for (start_col, end_col), text in merged_header:
+            span = end_col - start_col
+            cells[start_col] = _cell(
+                text, merged_pPr, f' gridSpan="{span}"' if span > 1 else ""
+            )
+            for col_idx in range(start_col + 1, end_col):
+                cells[col_idx] = EMPTY_CELL.replace("<a:tc>", '<a:tc hMerge="1">')
+        xml_rows.append(_row(row_heights[len(xml_rows)], cells))
+
+    xml_rows.append(
+        _row(
+            row_heights[len(xml_rows)],
+            [
+                _cell(str(name), header_pPr[col_idx > 0])
+                for col_idx, name in enumerate(header)
+            ],
+        )
+    )
+    for values in body:
+        xml_rows.append(
+            _row(
+                row_heights[len(xml_rows)],
+                [_cell(text, body_pPr[col_idx > 0]) for col_idx, text in enumerate(values)],
+            )
+        )
+
+    grid = "".join(f'<a:gridCol w="{w}"/>' for w in col_widths)
+    return parse_xml(
+        f"<p:graphicFrame {nsdecls('a', 'p')}>"
+        "<p:nvGraphicFramePr>"
+        f'<p:cNvPr id="{shape_id}" name="Table {shape_id - 1}"/>'
+        '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr>'
+        "<p:nvPr/>"
+        "</p:nvGraphicFramePr>"
+        f'<p:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></p:xfrm>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+        '<a:tbl><a:tblPr firstRow="1" bandRow="1">'
+        f"<a:tableStyleId>{TABLE_STYLE_ID}</a:tableStyleId></a:tblPr>"
+        f"<a:tblGrid>{grid}</a:tblGrid>"
+        f"{''.join(xml_rows)}"
+        "</a:tbl></a:graphicData></a:graphic>"
+        "</p:graphicFrame>"
+    )
@@ -0,0 +1,83 @@
+import re
+
+import pandas as pd
+
+# Footnote references ("[12]", "[a]") and any other character that is neither a
+# word character nor whitespace, removed in one pass
+CLEAN_PATTERN = re.compile(r"\[.*?\]|[^\w\s]")
+
+# The runs of a score cell and the "*" that marks a not-out innings, e.g. "248*[a]"
+SCORE_PATTERN = re.compile(r"(?P<runs>\d+(?:,\d{3})*)\s*(?P<not_out>\*)?")
+
+
+def _map_unique(series, clean):
+    """Applies the vectorized `clean` to each distinct value of `series` once."""
+    codes, uniques = pd.factorize(series)
+    return clean(pd.Series(uniques, dtype=object)), codes
+
+
+def clean_text(series):
+    """Returns `series` as text with footnotes and special characters removed.
+
+    Same result as removing the footnotes, then the special characters, then
+    stripping, cell by cell. The columns repeat a few venues, years and
+    opponents, so each distinct value is cleaned once, by the pandas string
+    methods."""
+    cleaned, codes = _map_unique(
+        series.astype(str),
+        lambda text: text.str.replace(CLEAN_PATTERN, "", regex=True).str.strip(),
+    )
+    return pd.Series(
+        cleaned.to_numpy()[codes], index=series.index, name=series.name, dtype=object
+    )
+
+
+def _compact_int(values):
+    """Returns the integer `values` in the smallest integer dtype that holds them.
+
+    Cells without a number make it the nullable dtype of that size, e.g. Int16."""
+    if values.isna().all():
+        return values.astype("Int8")
+    dtype = pd.to_numeric(values.dropna(), downcast="integer").dtype
+    if values.hasnans:
+        return values.astype(dtype.name.capitalize())
+    return values.astype(dtype)
+
+
+def parse_scores(series):
+    """Returns the `runs` (compact integers) and `not_out` flags of the score cells.
+
+    "248*" is 248 not out; footnotes and other markers around the number are
+    ignored, and a cell without a number has missing runs."""
+    found, codes = _map_unique(
+        series.astype(str), lambda text: text.str.extract(SCORE_PATTERN)
+    )
+    runs = pd.to_numeric(found["runs"].str.replace(",", "")).to_numpy()[codes]
+    not_out = found["not_out"].notna().to_numpy()[codes]
+    return pd.DataFrame(
+        {
+            "runs": _compact_int(pd.Series(runs, index=series.index)),
+            "not_out": not_out,
+        },
+        index=series.index,
+    )
+
+
+def clean_table(df, columns, score=None):
+    """Returns a scraped table with `columns` cleaned and the "No." column dropped.
+
+    With `score`, that column becomes the numeric runs (see parse_scores) and a
+    boolean `not_out` column is added next to it."""
+    df_cleaned = df.drop(columns=["No."], errors="ignore")
+
+    for col in columns:
+        if col in df_cleaned.columns and col != score:
+            df_cleaned[col] = clean_text(df_cleaned[col])
+    if score is not None:
+        scores = parse_scores(df_cleaned[score])
+        df_cleaned[score] = scores["runs"]
+        df_cleaned.insert(
+            df_cleaned.columns.get_loc(score) + 1, "not_out", scores["not_out"]
+        )
+    return df_cleaned
+
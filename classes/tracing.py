@@ -0,0 +1,170 @@
+import json
+import os
+import threading
+import time
+
+
+class Span:
+    """One timed section of a trace; use it as a context manager.
+
+    Attributes known only once the work is done, like the bytes written, are
+    added with set()."""
+
+    __slots__ = ("tracer", "name", "attributes", "start", "child_time")
+
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.child_time = 0
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self.tracer._stack().append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.tracer._finish(self, end)
+        return False
+
+
+class _NullSpan:
+    """Span of a disabled tracer; entering, leaving and set() do nothing."""
+
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """Tracer used when tracing is off; every span is the same no-op object."""
+
+    enabled = False
+
+    def span(self, name, **attributes):
+        return _NULL_SPAN
+
+
+NULL_TRACER = NullTracer()
+
+
+class Tracer:
+    """Records nestable timing spans of the deck pipeline.
+
+    Spans nest per thread, so the image downloads of the prefetch pool get their
+    own rows in the trace. The trace can be written as Chrome trace-event JSON
+    (open it in chrome://tracing or https://ui.perfetto.dev) and summarised per
+    span name, with the self time that excludes nested spans.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def span(self, name, **attributes):
+        return Span(self, name, attributes)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _finish(self, span, end):
+        stack = self._stack()
+        stack.pop()
+        duration = end - span.start
+        if stack:
+            stack[-1].child_time += duration
+
+        event = (
+            span.name,
+            span.start - self._origin,
+            duration,
+            duration - span.child_time,
+            threading.get_ident(),
+            span.attributes,
+        )
+        with self._lock:
+            self.events.append(event)
+
+    def chrome_trace(self):
+        """Returns the spans as a Chrome trace-event document."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": attributes,
+            }
+            for name, start, duration, _, tid, attributes in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+
+    def summary(self):
+        """Returns one row per span name, slowest total first, times in seconds."""
+        rows = {}
+        for name, _, duration, self_time, _, _ in self.events:
+            row = rows.setdefault(
+                name, {"name": name, "count": 0, "total": 0, "self": 0, "max": 0}
+            )
+            row["count"] += 1
+            row["total"] += duration
+            row["self"] += self_time
+            row["max"] = max(row["max"], duration)
+
+        summary = []
+        for row in sorted(rows.values(), key=lambda row: -row["total"]):
+            summary.append(
+                {
+                    "name": row["name"],
+                    "count": row["count"],
+                    "total": row["total"] / 1e9,
+                    "self": row["self"] / 1e9,
+                    "mean": row["total"] / row["count"] / 1e9,
+                    "max": row["max"] / 1e9,
+                }
+            )
+        return summary
+
+    def format_summary(self):
+        """Returns summary() as a text table."""
+        lines = [
+            f"{'span':<24} {'count':>7} {'total s':>9} {'self s':>9} "
+            f"{'mean ms':>9} {'max ms':>9}"
+        ]
+        for row in self.summary():
+            lines.append(
+                f"{row['name']:<24} {row['count']:>7} {row['total']:>9.3f} "
+                f"{row['self']:>9.3f} {row['mean'] * 1000:>9.2f} "
+                f"{row['max'] * 1000:>9.2f}"
+            )
+        return "\n".join(lines)
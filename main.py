@@ -4,11 +4,22 @@ for Male and Female Athletes.
 """
 
 # Import required modules
-import pandas as pd
+import argparse
+import os
 import sys
 
+# Charts are only ever written to files; never start an interactive backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 sys.path.append("Classes")
 import ppt_generator
+from data_loader import WorkbookLoader
+from image_cache import ImageCache
+from image_fetcher import ImageFetcher
+from image_preparer import ImagePreparer
+from memory_monitor import MemoryMonitor
+from render_cache import RenderCache
+from tracing import Tracer
 
 # Get PPT filter data ready
 PPT_DATA = {
@@ -20,24 +31,145 @@ PPT_DATA = {
     },
 }
 
-# Load data
-complete_data = pd.read_excel("processed_data.xlsx")
-personal_data = pd.read_excel("personal_data.xlsx")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate the player PPTs.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Render the per-player charts and HTML pages in N worker processes.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use only the photos and flags already in the local image cache.",
+    )
+    parser.add_argument(
+        "--rebuild-charts",
+        action="store_true",
+        help="Ignore the render cache and re-render every chart and HTML page.",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Patch the existing decks, rebuilding only the slides whose data changed.",
+    )
+    parser.add_argument(
+        "--html",
+        choices=ppt_generator.HTML_MODES,
+        default="pages",
+        help="Write one interactive HTML page per player, or one dashboard per deck.",
+    )
+    parser.add_argument(
+        "--decoration",
+        choices=ppt_generator.DECORATION_MODES,
+        default="boxes",
+        help="Decorate slides with random boxes, or with one seeded image per deck.",
+    )
+    parser.add_argument(
+        "--charts",
+        choices=ppt_generator.CHART_BACKENDS,
+        default="png",
+        help="Place the matplotlib chart images, or build native PowerPoint charts.",
+    )
+    parser.add_argument(
+        "--image-dpi",
+        type=int,
+        default=150,
+        help="Scale player photos and flags down to this DPI at their size on the slide.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write each player's slides to the deck as soon as they are built.",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Time each stage, write a Chrome trace to PATH and print a summary.",
+    )
+    parser.add_argument(
+        "--memory-report",
+        metavar="PATH",
+        help="Record the memory held after each player and write it to PATH as JSON.",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MB",
+        help="Stop with a memory report once the process uses more than MB megabytes.",
+    )
+    parser.add_argument(
+        "--prewarm-fonts",
+        action="store_true",
+        help="Build matplotlib's font cache for this environment and exit.",
+    )
+    return parser.parse_args()
+
+
+# The guard keeps worker processes (spawned on Windows/macOS) from re-running the job
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.prewarm_fonts:
+        from chart_renderer import prewarm_fonts
+
+        print(f"Font cache ready in {prewarm_fonts()}")
+        sys.exit()
+
+    # Load data (from the columnar snapshots while the workbooks are unchanged)
+    loader = WorkbookLoader()
+    complete_data = loader.load("processed_data.xlsx")
+    personal_data = loader.load("personal_data.xlsx")
+
+    tracer = Tracer() if args.trace else None
+    memory_monitor = (
+        MemoryMonitor(budget_mb=args.memory_budget)
+        if args.memory_report or args.memory_budget
+        else None
+    )
+
+    # Instantiate PPT Generator Class
+    runner = ppt_generator.PowerPointGenerator(
+        data=complete_data,
+        personal_data=personal_data,
+        image_fetcher=ImageFetcher(
+            cache=ImageCache(offline=args.offline), tracer=tracer
+        ),
+        render_cache=RenderCache(force=args.rebuild_charts),
+        image_preparer=ImagePreparer(dpi=args.image_dpi),
+        tracer=tracer,
+        memory_monitor=memory_monitor,
+    )
+
+    # Loop through each Key as in each PPT we wish to create
 
-# Instantiate PPT Generator Class
-runner = ppt_generator.PowerPointGenerator(
-    data=complete_data, personal_data=personal_data
-)
+    for key, item in PPT_DATA.items():
+        print(f"PPT Generating for: {key}")
+        print(item)
 
-# Loop through each Key as in each PPT we wish to create
+        runner._handle_general_flow(
+            key=key,
+            name=item["name"],
+            workers=args.workers,
+            update=args.update,
+            html_mode=args.html,
+            decoration=args.decoration,
+            stream=args.stream,
+            chart_backend=args.charts,
+        )
 
-for key, item in PPT_DATA.items():
-    print(f"PPT Generating for: {key}")
-    print(item)
+        print("\n\n")
 
-    runner._handle_general_flow(key=key, name=item["name"])
+    print("🙂 Done: Generating PPTs")
 
-    print("\n\n")
+    if memory_monitor is not None:
+        print(memory_monitor.report())
+        if args.memory_report:
+            memory_monitor.write_json(args.memory_report)
 
-print("🙂 Done: Generating PPTs")
+    if tracer is not None:
+        tracer.write_chrome_trace(args.trace)
+        print(tracer.format_summary())
+        print(f"Trace written to {args.trace}")
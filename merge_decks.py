@@ -0,0 +1,39 @@
+"""
+This file merges generated PPTs, e.g. the Male and Female decks,
+into one presentation without regenerating them.
+"""
+
+# Import required modules
+import argparse
+import sys
+import time
+
+sys.path.append("Classes")
+from deck_merger import merge_decks
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Merge generated player PPTs.")
+    parser.add_argument(
+        "decks",
+        nargs="+",
+        help="Decks to merge, in order; the first one supplies the intro and end slides.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="PPTS/player_All.pptx",
+        help="Where to save the merged deck.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    start = time.perf_counter()
+    merge_decks(args.decks, args.output)
+    print(
+        f"🙂 Done: Merged {len(args.decks)} PPTs into {args.output} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
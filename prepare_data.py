@@ -0,0 +1,76 @@
+"""
+This file rebuilds processed_data.xlsx, the centuries of every player,
+from the sources declared in classes/century_sources.py.
+"""
+
+# Import required modules
+import argparse
+import sys
+import time
+
+sys.path.append("Classes")
+from century_pipeline import CenturyPipeline
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rebuild processed_data.xlsx.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="processed_data.xlsx",
+        help="Where to write the centuries workbook.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Parse the HTML snapshots in the cache without touching the network.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Revalidate the cached HTML snapshots against the live pages.",
+    )
+    parser.add_argument(
+        "--mirror",
+        metavar="URL",
+        help="Fetch the pages from this server (same paths) instead of Wikipedia.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".html_cache",
+        help="Directory of the HTML snapshots.",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=4,
+        help="Fetch at most N pages at a time.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parse the pages in N worker processes.",
+    )
+    return parser.parse_args()
+
+
+# The guard keeps worker processes (spawned on Windows/macOS) from re-running the job
+if __name__ == "__main__":
+    args = parse_args()
+
+    start = time.perf_counter()
+    pipeline = CenturyPipeline(
+        cache_dir=args.cache_dir,
+        offline=args.offline,
+        refresh=args.refresh,
+        mirror=args.mirror,
+        fetch_workers=args.fetch_workers,
+        workers=args.workers,
+    )
+    centuries = pipeline.build()
+    centuries.to_excel(args.output)
+    print(
+        f"🙂 Done: Wrote {len(centuries)} centuries of {centuries['name'].nunique()} "
+        f"players to {args.output} in {time.perf_counter() - start:.1f}s"
+    )
@@ -0,0 +1,174 @@
+"""
+Runs ImageFetcher against a stub HTTP server on localhost: retries of 5xx
+responses, conditional GETs answered with 304, the fallback to a stale cached
+copy and offline mode.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+
+import http.server
+import os
+import shutil
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "classes"))
+
+from image_cache import ImageCache
+from image_fetcher import ImageFetcher
+from tracing import Tracer
+
+PHOTO = b"photo bytes"
+
+
+class StubServer:
+    """Serves scripted responses: each GET of a path takes the next (status,
+    body, headers) of its script, repeating the last one, and is recorded."""
+
+    def __init__(self, scripts):
+        self.scripts = {path: list(responses) for path, responses in scripts.items()}
+        self.requests = []
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.requests.append((self.path, dict(self.headers)))
+                script = stub.scripts.get(self.path, [(404, b"", {})])
+                status, body, headers = script.pop(0) if len(script) > 1 else script[0]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def hits(self, path):
+        return [headers for requested, headers in self.requests if requested == path]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def server():
+    stub = StubServer(
+        {
+            "/flaky": [(503, b"", {}), (200, PHOTO, {})],
+            "/down": [(503, b"", {})],
+            "/photo": [(200, PHOTO, {"ETag": '"v1"'}), (304, b"", {})],
+            "/evicted": [
+                (200, PHOTO, {"ETag": '"v1"'}),
+                (304, b"", {}),
+                (200, PHOTO, {"ETag": '"v1"'}),
+            ],
+            "/gone": [(200, PHOTO, {}), (404, b"", {})],
+        }
+    )
+    yield stub
+    stub.close()
+
+
+def fetcher(cache=None, tracer=None, retries=3):
+    return ImageFetcher(retries=retries, backoff_factor=0, cache=cache, tracer=tracer)
+
+
+def download_tags(tracer):
+    """Returns the cache tag of every image_download span, in order."""
+    return [
+        attributes.get("cache")
+        for name, _, _, _, _, attributes in tracer.events
+        if name == "image_download"
+    ]
+
+
+def test_retries_server_errors(server):
+    assert fetcher().get(server.url("/flaky")) == PHOTO
+    assert len(server.hits("/flaky")) == 2
+
+    # The first request and `retries` more, then the download gives up
+    assert fetcher(retries=2).get(server.url("/down")) is None
+    assert len(server.hits("/down")) == 3
+
+
+def test_does_not_retry_not_found(server):
+    assert fetcher().get(server.url("/missing")) is None
+    assert len(server.hits("/missing")) == 1
+
+
+def test_not_modified_revalidates_cached_copy(server, tmp_path):
+    url = server.url("/photo")
+    assert fetcher(cache=ImageCache(str(tmp_path))).get(url) == PHOTO
+
+    # Stale at once: the next fetcher has to revalidate with the stored ETag
+    tracer = Tracer()
+    cache = ImageCache(str(tmp_path), max_age=0)
+    assert fetcher(cache=cache, tracer=tracer).get(url) == PHOTO
+    assert server.hits("/photo")[1]["If-None-Match"] == '"v1"'
+    assert download_tags(tracer) == ["revalidated"]
+
+
+def test_not_modified_after_eviction_downloads_again(server, tmp_path):
+    url = server.url("/evicted")
+    fetcher(cache=ImageCache(str(tmp_path))).get(url)
+
+    # A concurrent store() evicts the blob after the validators were sent
+    cache = ImageCache(str(tmp_path), max_age=0)
+    validators = cache.validators
+
+    def validators_then_evict(url):
+        headers = validators(url)
+        shutil.rmtree(tmp_path / "objects")
+        return headers
+
+    cache.validators = validators_then_evict
+    tracer = Tracer()
+    assert fetcher(cache=cache, tracer=tracer).get(url) == PHOTO
+    hits = server.hits("/evicted")
+    assert len(hits) == 3
+    assert hits[1]["If-None-Match"] == '"v1"' and "If-None-Match" not in hits[2]
+    assert download_tags(tracer) == ["miss"]
+    assert ImageCache(str(tmp_path)).read(url) == PHOTO
+
+
+def test_failed_download_falls_back_to_stale_copy(server, tmp_path):
+    url = server.url("/gone")
+    fetcher(cache=ImageCache(str(tmp_path))).get(url)
+
+    tracer = Tracer()
+    cache = ImageCache(str(tmp_path), max_age=0)
+    assert fetcher(cache=cache, tracer=tracer).get(url) == PHOTO
+    assert len(server.hits("/gone")) == 2
+    assert download_tags(tracer) == ["stale"]
+
+
+def test_fresh_entries_are_served_from_disk(server, tmp_path):
+    url = server.url("/photo")
+    fetcher(cache=ImageCache(str(tmp_path))).get(url)
+
+    assert fetcher(cache=ImageCache(str(tmp_path))).get(url) == PHOTO
+    assert len(server.hits("/photo")) == 1
+
+
+def test_offline_never_touches_the_network(server, tmp_path):
+    url = server.url("/photo")
+    fetcher(cache=ImageCache(str(tmp_path))).get(url)
+
+    offline = fetcher(cache=ImageCache(str(tmp_path), max_age=0, offline=True))
+    offline.prefetch([url, server.url("/flaky")])
+    assert offline.contents == {url: PHOTO, server.url("/flaky"): None}
+    assert len(server.requests) == 1
+    assert offline._session is None